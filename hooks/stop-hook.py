@@ -13,21 +13,37 @@ Smart filtering rules:
 - Deduplicate recent saves
 """
 
-import hashlib
 import json
 import os
 import re
 import sys
-import urllib.request
-import urllib.error
-from datetime import datetime
+import time
 from pathlib import Path
 
-KIROKU_API = os.environ.get("KIROKU_API", "http://localhost:8000")
-CACHE_DIR = Path.home() / ".cache" / "kiroku-memory"
-CACHE_FILE = CACHE_DIR / "recent_saves.json"
+# Helpers shared with the skill's stop hooks live in skill/scripts
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "skill" / "scripts"))
+
+from hook_common import (
+    MAX_PARALLEL_POSTS,
+    TRANSCRIPT_BUFFER_SIZE,
+    APIStatusError,
+    api_post,
+    close_api,
+    get_project_name,
+    get_transcript_offset,
+    index_recent_saves,
+    is_duplicate,
+    json_loads,
+    load_recent_saves,
+    mark_saved,
+    may_be_message,
+    save_recent_saves,
+    set_transcript_offset,
+    spawn_detached,
+)
+
 MIN_CONTENT_LENGTH = 50
-DEDUP_HOURS = 24
+TAIL_BLOCK_SIZE = 64 * 1024  # Block size when scanning the transcript from the end
 
 # Patterns that indicate save-worthy content
 SAVE_PATTERNS = [
@@ -42,108 +58,112 @@ SAVE_PATTERNS = [
     r"(?:架構|architecture|design)\s*(?:決定|decision)",
 ]
 
-# Patterns that indicate noise (should NOT save)
+# Noise (should NOT save): plain literals are checked with str methods,
+# which is cheaper than running them through the regex engine
+NOISE_PREFIXES = (
+    "請", "please", "can you", "could you",
+    "什麼", "怎麼", "如何", "what", "how", "why", "when", "where",
+)
+NOISE_SUBSTRINGS = ("error", "錯誤", "failed", "失敗")
+
+# Noise that needs a regex (whole-message acknowledgements)
 NOISE_PATTERNS = [
     r"^(?:ok|好的?|是的?|對|沒問題|understood|got it|sure|yes|no)[\s.!]*$",
     r"^(?:謝謝|thanks?|thank you)[\s.!]*$",
-    r"^(?:請|please|can you|could you)",
-    r"^(?:什麼|怎麼|如何|what|how|why|when|where)\s*(?:是|意思)?",
-    r"(?:error|錯誤|failed|失敗)",
 ]
 
 
-def get_project_name(cwd: str) -> str:
-    """Extract project name from cwd."""
-    if cwd:
-        return os.path.basename(cwd)
-    return None
-
-
-def load_recent_saves() -> dict:
-    """Load recently saved content hashes."""
-    try:
-        if CACHE_FILE.exists():
-            with open(CACHE_FILE) as f:
-                return json.load(f)
-    except Exception:
-        pass
-    return {"saves": [], "last_cleanup": datetime.now().isoformat()}
-
-
-def save_recent_saves(data: dict):
-    """Save recent content hashes."""
-    try:
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        with open(CACHE_FILE, "w") as f:
-            json.dump(data, f)
-    except Exception:
-        pass
-
-
-def content_hash(content: str, source: str) -> str:
-    """Generate hash for deduplication."""
-    return hashlib.md5(f"{source}:{content}".encode()).hexdigest()
+def _union(patterns: list, flags: int = 0) -> re.Pattern:
+    """Merge patterns into one precompiled alternation (single pass per search).
 
+    Patterns are written in lowercase and matched against lowercased text,
+    so no case folding is needed inside the regex engine.
+    """
+    # An empty list must never match (a bare "" would match everything)
+    return re.compile("|".join(f"(?:{p})" for p in patterns) or "(?!)", flags)
 
-def is_duplicate(content: str, source: str, recent: dict) -> bool:
-    """Check if content was recently saved."""
-    h = content_hash(content, source)
-    now = datetime.now()
 
-    # Clean old entries
-    cutoff = now.timestamp() - (DEDUP_HOURS * 3600)
-    recent["saves"] = [
-        s for s in recent["saves"]
-        if s.get("ts", 0) > cutoff
-    ]
-
-    # Check for duplicate
-    for s in recent["saves"]:
-        if s.get("hash") == h:
-            return True
-
-    return False
-
-
-def mark_saved(content: str, source: str, recent: dict):
-    """Mark content as saved."""
-    recent["saves"].append({
-        "hash": content_hash(content, source),
-        "ts": datetime.now().timestamp()
-    })
-    save_recent_saves(recent)
+SAVE_RE = _union(SAVE_PATTERNS)
+# Anchored noise only needs to look at the start of the message; leading
+# whitespace is skipped here so callers don't need to strip() first
+NOISE_PREFIX_RE = _union([r"\s*" + p[1:] for p in NOISE_PATTERNS if p.startswith("^")])
+NOISE_ANY_RE = _union([p for p in NOISE_PATTERNS if not p.startswith("^")])
 
 
 def should_save(content: str) -> bool:
     """Determine if content is worth saving."""
-    content_lower = content.lower().strip()
-
     # Too short
     if len(content) < MIN_CONTENT_LENGTH:
         return False
 
+    text = content.lower()
+
     # Check noise patterns
-    for pattern in NOISE_PATTERNS:
-        if re.search(pattern, content_lower, re.IGNORECASE):
-            return False
+    if (
+        text.lstrip().startswith(NOISE_PREFIXES)
+        or any(s in text for s in NOISE_SUBSTRINGS)
+        or NOISE_PREFIX_RE.match(text)
+        or NOISE_ANY_RE.search(text)
+    ):
+        return False
 
     # Check save patterns
-    for pattern in SAVE_PATTERNS:
-        if re.search(pattern, content_lower, re.IGNORECASE):
-            return True
-
-    return False
-
-
-def extract_saveable_content(transcript_path: str) -> list:
-    """Extract save-worthy content from transcript."""
-    candidates = []
+    return SAVE_RE.search(text) is not None
+
+
+def complete_lines_end(f, offset: int) -> int:
+    """Offset just past the last complete line at or after offset.
+
+    A partially written last entry is left for the next run.
+    """
+    f.seek(0, os.SEEK_END)
+    end = f.tell()
+    while end > offset:
+        step = min(TAIL_BLOCK_SIZE, end - offset)
+        f.seek(end - step)
+        newline = f.read(step).rfind(b"\n")
+        if newline >= 0:
+            return end - step + newline + 1
+        end -= step
+    return offset
+
+
+def iter_lines_backwards(f, start: int, end: int):
+    """Yield the non-empty lines between byte offsets start and end, newest first."""
+    pos = end
+    head = b""
+    while pos > start:
+        step = min(TAIL_BLOCK_SIZE, pos - start)
+        pos -= step
+        f.seek(pos)
+        lines = (f.read(step) + head).split(b"\n")
+        head = lines.pop(0)  # May continue in the previous block
+        for line in reversed(lines):
+            if line:
+                yield line
+    if head:
+        yield head
+
+
+def extract_saveable_content(transcript_path: str, offset: int = 0) -> tuple[list, int]:
+    """Extract save-worthy content from transcript, starting at byte offset.
+
+    Scans from the end of the file and stops at the last 3 unique
+    candidates. Returns them (oldest first) and the offset just past the
+    last complete line.
+    """
+    seen = set()
+    unique = []
+    end = offset
 
     try:
-        with open(transcript_path) as f:
-            for line in f:
+        with open(transcript_path, "rb", buffering=TRANSCRIPT_BUFFER_SIZE) as f:
+            end = complete_lines_end(f, offset)
+            for line in iter_lines_backwards(f, offset, end):
+                if not may_be_message(line, (b'"user"',)):
+                    continue
                 try:
-                    entry = json.loads(line)
+                    entry = json_loads(line)
                     role = entry.get("role", "")
                     content = ""
 
@@ -151,74 +171,122 @@ def extract_saveable_content(transcript_path: str) -> list:
                     if role == "user":
                         msg = entry.get("message", {})
                         if isinstance(msg, dict):
-                            content_list = msg.get("content", [])
-                            for c in content_list:
-                                if isinstance(c, dict) and c.get("type") == "text":
-                                    content = c.get("text", "")
-                                    break
+                            content = next(
+                                (c.get("text", "") for c in msg.get("content", [])
+                                 if isinstance(c, dict) and c.get("type") == "text"),
+                                "",
+                            )
                         elif isinstance(msg, str):
                             content = msg
 
-                    if content and should_save(content):
-                        candidates.append(content)
+                    if content and content not in seen and should_save(content):
+                        seen.add(content)
+                        unique.append(content)
+                        if len(unique) >= 3:
+                            break
 
                 except json.JSONDecodeError:
                     continue
     except Exception:
         pass
 
-    # Return unique candidates, last 3 only
-    seen = set()
-    unique = []
-    for c in reversed(candidates):
-        if c not in seen:
-            seen.add(c)
-            unique.append(c)
-        if len(unique) >= 3:
-            break
+    return list(reversed(unique)), end
+
 
-    return list(reversed(unique))
+def ingest_payload(content: str, source: str) -> dict:
+    """Request body for one /ingest item."""
+    return {
+        "content": content,
+        "source": source,
+        "metadata": {"auto_saved": True, "hook": "stop"}
+    }
 
 
-def ingest_memory(content: str, source: str) -> bool:
-    """Send content to Kiroku Memory API."""
+def ingest_memory(content: str, source: str) -> str | None:
+    """Send content to Kiroku Memory API.
+
+    Returns the new resource id ("" if none was returned), or None on failure.
+    """
     try:
-        payload = {
-            "content": content,
-            "source": source,
-            "metadata": {"auto_saved": True, "hook": "stop"}
-        }
-
-        data = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(
-            f"{KIROKU_API}/ingest",
-            data=data,
-            headers={"Content-Type": "application/json"},
-            method="POST"
-        )
-
-        with urllib.request.urlopen(req, timeout=5) as resp:
-            result = json.loads(resp.read().decode("utf-8"))
-            resource_id = result.get("resource_id")
-
-            # Try to extract facts (non-blocking)
-            if resource_id:
-                try:
-                    extract_payload = json.dumps({"resource_id": resource_id}).encode()
-                    extract_req = urllib.request.Request(
-                        f"{KIROKU_API}/extract",
-                        data=extract_payload,
-                        headers={"Content-Type": "application/json"},
-                        method="POST"
-                    )
-                    urllib.request.urlopen(extract_req, timeout=10)
-                except Exception:
-                    pass
-
-            return True
+        result = json.loads(api_post("/ingest", ingest_payload(content, source)))
+        return result.get("resource_id") or ""
 
     except Exception:
-        return False
+        return None
+
+
+def ingest_batch(candidates: list, source: str) -> list | None:
+    """Send all candidates to /ingest/batch in one request.
+
+    Returns ingest_memory-style results in input order, or None if the
+    server has no batch endpoint (an older server). Any other failure marks
+    every candidate as failed rather than retrying them one by one: part of
+    the batch may already be stored, and re-posting would duplicate it.
+    """
+    failed = [None] * len(candidates)
+    try:
+        payload = {"items": [ingest_payload(c, source) for c in candidates]}
+        results = json.loads(api_post("/ingest/batch", payload))
+        if len(results) != len(candidates):
+            return failed
+        return [r.get("resource_id") or "" for r in results]
+    except APIStatusError as e:
+        return None if e.status in (404, 405) else failed
+    except Exception:
+        return failed
+    finally:
+        close_api()
+
+
+def _ingest_one(content: str, source: str) -> str | None:
+    """Ingest content on this worker thread's connection."""
+    try:
+        return ingest_memory(content, source)
+    finally:
+        close_api()
+
+
+def ingest_all(candidates: list, source: str) -> list:
+    """Ingest candidates in one batch request; returns ingest_memory results in input order.
+
+    Falls back to concurrent single-item requests if the batch endpoint
+    isn't available.
+    """
+    if not candidates:
+        return []
+    results = ingest_batch(candidates, source)
+    if results is not None:
+        return results
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(len(candidates), MAX_PARALLEL_POSTS)) as pool:
+        return list(pool.map(_ingest_one, candidates, [source] * len(candidates)))
+
+
+def spawn_extract_worker(resource_ids: list):
+    """Run fact extraction in a detached copy of this script.
+
+    Extraction can take several seconds per resource; the hook doesn't
+    wait for it.
+    """
+    if not resource_ids:
+        return
+    try:
+        spawn_detached([sys.executable, str(Path(__file__).resolve()), "--extract", *resource_ids])
+    except Exception:
+        pass
+
+
+def run_extract_worker(resource_ids: list):
+    """Background entry point: extract facts for freshly ingested resources."""
+    try:
+        for resource_id in resource_ids:
+            try:
+                api_post("/extract", {"resource_id": resource_id}, timeout=10)
+            except Exception:
+                pass
+    finally:
+        close_api()
 
 
 def main():
@@ -235,21 +303,35 @@ def main():
         project = get_project_name(cwd)
         source = f"project:{project}" if project else "global:user"
 
-        # Load recent saves for deduplication
+        # Load recent saves for deduplication (one timestamp for the whole run)
+        now = time.time()
         recent = load_recent_saves()
+        live = index_recent_saves(recent, now)
 
-        # Extract saveable content
-        candidates = extract_saveable_content(transcript_path)
+        # Extract saveable content appended since the last run
+        offset = get_transcript_offset(recent, transcript_path)
+        candidates, end = extract_saveable_content(transcript_path, offset)
 
-        # Save each candidate
+        # Save new candidates (requests are independent, send them concurrently)
+        pending = [c for c in candidates if not is_duplicate(c, source, live)]
         saved_count = 0
-        for content in candidates:
-            if is_duplicate(content, source, recent):
-                continue
-
-            if ingest_memory(content, source):
-                mark_saved(content, source, recent)
-                saved_count += 1
+        advanced = False
+        try:
+            results = ingest_all(pending, source)
+            for content, resource_id in zip(pending, results):
+                if resource_id is not None:
+                    mark_saved(content, source, recent, live, now)
+                    saved_count += 1
+            # Extract facts in the background
+            spawn_extract_worker([r for r in results if r])
+            # Only skip past this chunk once everything in it was stored
+            if end != offset and None not in results:
+                set_transcript_offset(recent, transcript_path, end)
+                advanced = True
+        finally:
+            # Persist once, even if a later candidate blew up
+            if saved_count or advanced:
+                save_recent_saves(recent)
 
         # Silent success
         sys.exit(0)
@@ -261,4 +343,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if sys.argv[1:2] == ["--extract"]:
+        run_extract_worker(sys.argv[2:])
+    else:
+        main()
@@ -48,6 +48,13 @@ class IngestResponse(BaseModel):
     created_at: datetime
 
 
+MAX_INGEST_BATCH = 500  # Items accepted by one /ingest/batch call
+
+
+class IngestBatchRequest(BaseModel):
+    items: list[IngestRequest] = Field(max_length=MAX_INGEST_BATCH)
+
+
 class ResourceOut(BaseModel):
     id: UUID
     created_at: datetime
@@ -158,6 +165,26 @@ async def ingest_endpoint(request: IngestRequest):
         )
 
 
+@app.post("/ingest/batch", response_model=list[IngestResponse])
+async def ingest_batch_endpoint(request: IngestBatchRequest):
+    """Ingest several raw messages in one request"""
+    entities = [
+        ResourceEntity(
+            content=item.content,
+            source=item.source,
+            metadata=item.metadata or {},
+        )
+        for item in request.items
+    ]
+    async with get_unit_of_work() as uow:
+        await uow.resources.create_many(entities)
+        await uow.commit()
+        return [
+            IngestResponse(resource_id=e.id, created_at=e.created_at)
+            for e in entities
+        ]
+
+
 @app.get("/resources", response_model=list[ResourceOut])
 async def list_resources_endpoint(
     source: Optional[str] = None,
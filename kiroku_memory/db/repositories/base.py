@@ -26,6 +26,11 @@ class ResourceRepository(ABC):
         """Create a new resource, return its ID"""
         ...
 
+    @abstractmethod
+    async def create_many(self, entities: Sequence[ResourceEntity]) -> list[UUID]:
+        """Create multiple resources, return their IDs"""
+        ...
+
     @abstractmethod
     async def get(self, resource_id: UUID) -> Optional[ResourceEntity]:
         """Get resource by ID"""
@@ -347,6 +352,11 @@ class CategoryAccessRepository(ABC):
         """Log a category access"""
         ...
 
+    @abstractmethod
+    async def create_many(self, entities: Sequence[CategoryAccessEntity]) -> list[UUID]:
+        """Log multiple category accesses, return their IDs"""
+        ...
+
     @abstractmethod
     async def get_recent(
         self,
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import Optional
+from typing import Optional, Sequence
 from uuid import UUID
 
 from sqlalchemy import select, delete, func
@@ -45,6 +45,13 @@ class PostgresCategoryAccessRepository(CategoryAccessRepository):
         await self._session.flush()
         return model.id
 
+    async def create_many(self, entities: Sequence[CategoryAccessEntity]) -> list[UUID]:
+        """Log multiple category accesses, return their IDs"""
+        models = [self._to_model(e) for e in entities]
+        self._session.add_all(models)
+        await self._session.flush()
+        return [m.id for m in models]
+
     async def get_recent(
         self,
         category: Optional[str] = None,
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Optional, Sequence
 from uuid import UUID
 
 from sqlalchemy import select, func, delete, and_
@@ -49,6 +49,13 @@ class PostgresResourceRepository(ResourceRepository):
         await self._session.flush()
         return model.id
 
+    async def create_many(self, entities: Sequence[ResourceEntity]) -> list[UUID]:
+        """Create multiple resources, return their IDs"""
+        models = [self._to_model(e) for e in entities]
+        self._session.add_all(models)
+        await self._session.flush()
+        return [m.id for m in models]
+
     async def get(self, resource_id: UUID) -> Optional[ResourceEntity]:
         """Get resource by ID"""
         result = await self._session.execute(
@@ -3,7 +3,7 @@
 from __future__ import annotations
 
 from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, Sequence
 from uuid import UUID
 
 from ...entities import CategoryAccessEntity
@@ -81,6 +81,35 @@ class SurrealCategoryAccessRepository(CategoryAccessRepository):
 
         return entity.id
 
+    async def create_many(self, entities: Sequence[CategoryAccessEntity]) -> list[UUID]:
+        """Log multiple category accesses in a single query, return their IDs"""
+        if not entities:
+            return []
+
+        rows = [
+            {
+                "uuid": str(e.id),
+                "category": e.category,
+                "accessed_at": self._ensure_tz(e.accessed_at),
+                "source": e.source,
+            }
+            for e in entities
+        ]
+        await self._client.query(
+            """
+            FOR $row IN $rows {
+                CREATE type::thing("category_access", $row.uuid) CONTENT {
+                    category: $row.category,
+                    accessed_at: $row.accessed_at,
+                    source: $row.source
+                };
+            }
+            """,
+            {"rows": rows},
+        )
+
+        return [e.id for e in entities]
+
     def _ensure_tz(self, dt: datetime) -> datetime:
         """Ensure datetime has timezone for SurrealDB"""
         from datetime import timezone as tz
@@ -164,12 +164,26 @@ class SurrealEmbeddingRepository(EmbeddingRepository):
         return results
 
     async def batch_upsert(self, embeddings: dict[UUID, list[float]]) -> int:
-        """Batch insert/update embeddings, return count"""
-        count = 0
-        for item_id, vector in embeddings.items():
-            await self.upsert(item_id, vector)
-            count += 1
-        return count
+        """Batch insert/update embeddings in a single query, return count"""
+        if not embeddings:
+            return 0
+
+        await self._client.query(
+            """
+            FOR $row IN $rows {
+                UPDATE type::thing("item", $row.uuid) SET
+                    embedding = $row.embedding,
+                    embedding_dim = $row.dim;
+            }
+            """,
+            {
+                "rows": [
+                    {"uuid": str(item_id), "embedding": vector, "dim": len(vector)}
+                    for item_id, vector in embeddings.items()
+                ],
+            },
+        )
+        return len(embeddings)
 
     async def count(self) -> int:
         """Count total embeddings (items with embedding field set)"""
@@ -184,42 +198,17 @@ class SurrealEmbeddingRepository(EmbeddingRepository):
 
     async def delete_stale(self, active_item_ids: list[UUID]) -> int:
         """Delete embeddings not in active_item_ids list (set to null)"""
-        if not active_item_ids:
-            # Clear all embeddings if no active items
-            count_result = await self._client.query(
-                "SELECT count() FROM item WHERE embedding IS NOT NONE GROUP ALL",
-                {},
-            )
-            count = count_result[0].get("count", 0) if count_result else 0
-
-            await self._client.query(
-                "UPDATE item SET embedding = NONE, embedding_dim = NONE WHERE embedding IS NOT NONE",
-                {},
-            )
-            return count
-
-        # Convert UUIDs to record IDs
         from surrealdb import RecordID
-        active_ids = [RecordID("item", str(item_id)) for item_id in active_item_ids]
 
-        # Count stale embeddings
-        count_result = await self._client.query(
-            """
-            SELECT count() FROM item
-            WHERE embedding IS NOT NONE AND id NOT IN $active_ids
-            GROUP ALL
-            """,
-            {"active_ids": active_ids},
-        )
-        count = count_result[0].get("count", 0) if count_result else 0
+        # Clear and count in one statement; RETURN id keeps the reply small
+        condition = "embedding IS NOT NONE"
+        params = {}
+        if active_item_ids:
+            condition += " AND id NOT IN $active_ids"
+            params["active_ids"] = [RecordID("item", str(item_id)) for item_id in active_item_ids]
 
-        # Clear stale embeddings
-        await self._client.query(
-            """
-            UPDATE item SET embedding = NONE, embedding_dim = NONE
-            WHERE embedding IS NOT NONE AND id NOT IN $active_ids
-            """,
-            {"active_ids": active_ids},
+        result = await self._client.query(
+            f"UPDATE item SET embedding = NONE, embedding_dim = NONE WHERE {condition} RETURN id",
+            params,
         )
-
-        return count
+        return len(result) if result else 0
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-from collections import deque
 from datetime import datetime
 from typing import TYPE_CHECKING, Optional, Sequence
 from uuid import UUID
@@ -14,6 +13,17 @@ if TYPE_CHECKING:
     from surrealdb import AsyncSurreal
 
 
+# Record body shared by create() and create_many(); fields come from $row
+_EDGE_CONTENT = """{
+    id: type::thing("graph_edge", $row.uuid),
+    subject: $row.subject,
+    predicate: $row.predicate,
+    object: $row.object,
+    weight: $row.weight,
+    created_at: $row.created_at
+}"""
+
+
 class SurrealGraphRepository(GraphRepository):
     """
     SurrealDB implementation using SurrealQL.
@@ -77,47 +87,42 @@ class SurrealGraphRepository(GraphRepository):
             {},
         )
 
-    async def create(self, entity: GraphEdgeEntity) -> UUID:
-        """Create a graph edge"""
+    def _to_params(self, entity: GraphEdgeEntity) -> dict:
+        """Convert domain entity to query parameters for _EDGE_CONTENT"""
         from datetime import timezone
-        from surrealdb import RecordID
-
-        record_id = RecordID("graph_edge", str(entity.id))
 
         # Ensure datetime has timezone for SurrealDB
         created_at = entity.created_at
         if created_at.tzinfo is None:
             created_at = created_at.replace(tzinfo=timezone.utc)
 
+        return {
+            "uuid": str(entity.id),
+            "subject": entity.subject,
+            "predicate": entity.predicate,
+            "object": entity.object,
+            "weight": entity.weight,
+            "created_at": created_at,
+        }
+
+    async def create(self, entity: GraphEdgeEntity) -> UUID:
+        """Create a graph edge"""
         await self._client.query(
-            """
-            CREATE $id CONTENT {
-                subject: $subject,
-                predicate: $predicate,
-                object: $object,
-                weight: $weight,
-                created_at: $created_at
-            }
-            """,
-            {
-                "id": record_id,
-                "subject": entity.subject,
-                "predicate": entity.predicate,
-                "object": entity.object,
-                "weight": entity.weight,
-                "created_at": created_at,
-            },
+            f"CREATE graph_edge CONTENT {_EDGE_CONTENT}",
+            {"row": self._to_params(entity)},
         )
-
         return entity.id
 
     async def create_many(self, entities: Sequence[GraphEdgeEntity]) -> list[UUID]:
-        """Create multiple edges"""
-        ids = []
-        for entity in entities:
-            edge_id = await self.create(entity)
-            ids.append(edge_id)
-        return ids
+        """Create multiple edges in a single query"""
+        if not entities:
+            return []
+
+        await self._client.query(
+            f"FOR $row IN $rows {{ CREATE graph_edge CONTENT {_EDGE_CONTENT}; }}",
+            {"rows": [self._to_params(e) for e in entities]},
+        )
+        return [e.id for e in entities]
 
     async def get_by_subject(self, subject: str) -> list[GraphEdgeEntity]:
         """Get all edges from a subject"""
@@ -208,52 +213,60 @@ class SurrealGraphRepository(GraphRepository):
         max_depth: int = 2,
         max_paths: int = 20,
     ) -> list[GraphPath]:
-        """BFS find paths from source."""
+        """BFS find paths from source, one neighbor query per depth level."""
         max_depth = min(max_depth, 3)
         paths: list[GraphPath] = []
-        queue: deque[tuple[str, list[str], list[GraphEdgeEntity], float]] = deque()
-        queue.append((source, [source], [], 1.0))
+        frontier: list[tuple[str, list[str], list[GraphEdgeEntity], float]] = [
+            (source, [source], [], 1.0)
+        ]
         visited_edges: set[tuple[str, str, str]] = set()
 
-        while queue:
-            entity, hops, path_edges, w = queue.popleft()
-            if len(hops) - 1 >= max_depth:
-                continue
+        for _ in range(max_depth):
+            if not frontier:
+                break
 
+            # Fetch edges touching every entity on this level in one round-trip
+            entities = {entity for entity, _, _, _ in frontier}
             result = await self._client.query(
                 """
                 SELECT * FROM graph_edge
-                WHERE subject = $entity OR object = $entity
+                WHERE subject IN $entities OR object IN $entities
                 """,
-                {"entity": entity},
+                {"entities": list(entities)},
             )
-            neighbors = [self._to_entity(r) for r in result] if result else []
-
-            for edge in neighbors:
-                edge_triple = (edge.subject, edge.predicate, edge.object)
-                if edge_triple in visited_edges:
-                    continue
-                visited_edges.add(edge_triple)
-
-                next_entity = edge.object if edge.subject == entity else edge.subject
-                if next_entity in hops:
-                    continue
-
-                new_hops = hops + [next_entity]
-                new_edges = path_edges + [edge]
-                new_weight = w * edge.weight
-
-                paths.append(GraphPath(
-                    source=source,
-                    target=next_entity,
-                    edges=new_edges,
-                    hops=new_hops,
-                    distance=len(new_edges),
-                    weight=new_weight,
-                ))
-
-                if len(new_hops) - 1 < max_depth:
-                    queue.append((next_entity, new_hops, new_edges, new_weight))
+            neighbors: dict[str, list[GraphEdgeEntity]] = {}
+            for record in result or []:
+                edge = self._to_entity(record)
+                for endpoint in {edge.subject, edge.object} & entities:
+                    neighbors.setdefault(endpoint, []).append(edge)
+
+            next_frontier = []
+            for entity, hops, path_edges, w in frontier:
+                for edge in neighbors.get(entity, ()):
+                    edge_triple = (edge.subject, edge.predicate, edge.object)
+                    if edge_triple in visited_edges:
+                        continue
+                    visited_edges.add(edge_triple)
+
+                    next_entity = edge.object if edge.subject == entity else edge.subject
+                    if next_entity in hops:
+                        continue
+
+                    new_hops = hops + [next_entity]
+                    new_edges = path_edges + [edge]
+                    new_weight = w * edge.weight
+
+                    paths.append(GraphPath(
+                        source=source,
+                        target=next_entity,
+                        edges=new_edges,
+                        hops=new_hops,
+                        distance=len(new_edges),
+                        weight=new_weight,
+                    ))
+                    next_frontier.append((next_entity, new_hops, new_edges, new_weight))
+
+            frontier = next_frontier
 
         paths.sort(key=lambda p: p.weight, reverse=True)
 
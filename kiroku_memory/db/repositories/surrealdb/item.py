@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import sys
 from datetime import datetime, timedelta
 from typing import TYPE_CHECKING, Optional, Sequence
 from uuid import UUID
@@ -13,6 +14,30 @@ if TYPE_CHECKING:
     from surrealdb import AsyncSurreal
 
 
+# Record body shared by create() and create_many(); fields come from $row
+_ITEM_CONTENT = """{
+    id: type::thing("item", $row.uuid),
+    created_at: time::now(),
+    subject: $row.subject,
+    predicate: $row.predicate,
+    object: $row.object,
+    category: $row.category,
+    confidence: $row.confidence,
+    status: $row.status,
+    resource: IF $row.resource_id != NONE THEN type::thing("resource", $row.resource_id) ELSE NONE END,
+    supersedes: IF $row.supersedes_id != NONE THEN type::thing("item", $row.supersedes_id) ELSE NONE END,
+    meta_about: IF $row.meta_about_id != NONE THEN type::thing("item", $row.meta_about_id) ELSE NONE END,
+    canonical_subject: $row.canonical_subject,
+    canonical_object: $row.canonical_object,
+    embedding: $row.embedding
+}"""
+
+
+def _intern(value: Optional[str]) -> Optional[str]:
+    """Intern small-vocabulary strings so loaded items share one copy each"""
+    return sys.intern(value) if value else value
+
+
 class SurrealItemRepository(ItemRepository):
     """SurrealDB implementation using SurrealQL"""
 
@@ -84,80 +109,52 @@ class SurrealItemRepository(ItemRepository):
             subject=record.get("subject"),
             predicate=record.get("predicate"),
             object=record.get("object"),
-            category=record.get("category"),
+            category=_intern(record.get("category")),
             confidence=float(record.get("confidence", 1.0)),
             status=record.get("status", "active"),
             supersedes=supersedes,
-            canonical_subject=record.get("canonical_subject"),
-            canonical_object=record.get("canonical_object"),
+            canonical_subject=_intern(record.get("canonical_subject")),
+            canonical_object=_intern(record.get("canonical_object")),
             meta_about=meta_about,
             embedding=record.get("embedding"),
         )
 
+    def _to_params(self, entity: ItemEntity) -> dict:
+        """Convert domain entity to query parameters for _ITEM_CONTENT"""
+        return {
+            "uuid": str(entity.id),
+            "subject": entity.subject,
+            "predicate": entity.predicate,
+            "object": entity.object,
+            "category": entity.category,
+            "confidence": entity.confidence,
+            "status": entity.status,
+            "resource_id": str(entity.resource_id) if entity.resource_id else None,
+            "supersedes_id": str(entity.supersedes) if entity.supersedes else None,
+            "meta_about_id": str(entity.meta_about) if entity.meta_about else None,
+            "canonical_subject": entity.canonical_subject,
+            "canonical_object": entity.canonical_object,
+            "embedding": entity.embedding,
+        }
+
     async def create(self, entity: ItemEntity) -> UUID:
         """Create a single item, return its ID"""
-        uuid_str = str(entity.id)
-
-        # Build content with proper record ID references
-        resource_ref = None
-        if entity.resource_id:
-            resource_ref = str(entity.resource_id)
-
-        supersedes_ref = None
-        if entity.supersedes:
-            supersedes_ref = str(entity.supersedes)
-
-        meta_about_ref = None
-        if entity.meta_about:
-            meta_about_ref = str(entity.meta_about)
-
-        query = """
-            CREATE item CONTENT {
-                id: type::thing("item", $uuid),
-                created_at: time::now(),
-                subject: $subject,
-                predicate: $predicate,
-                object: $object,
-                category: $category,
-                confidence: $confidence,
-                status: $status,
-                resource: IF $resource_id != NONE THEN type::thing("resource", $resource_id) ELSE NONE END,
-                supersedes: IF $supersedes_id != NONE THEN type::thing("item", $supersedes_id) ELSE NONE END,
-                meta_about: IF $meta_about_id != NONE THEN type::thing("item", $meta_about_id) ELSE NONE END,
-                canonical_subject: $canonical_subject,
-                canonical_object: $canonical_object,
-                embedding: $embedding
-            }
-        """
-
         await self._client.query(
-            query,
-            {
-                "uuid": uuid_str,
-                "subject": entity.subject,
-                "predicate": entity.predicate,
-                "object": entity.object,
-                "category": entity.category,
-                "confidence": entity.confidence,
-                "status": entity.status,
-                "resource_id": resource_ref,
-                "supersedes_id": supersedes_ref,
-                "meta_about_id": meta_about_ref,
-                "canonical_subject": entity.canonical_subject,
-                "canonical_object": entity.canonical_object,
-                "embedding": entity.embedding,
-            },
+            f"CREATE item CONTENT {_ITEM_CONTENT}",
+            {"row": self._to_params(entity)},
         )
-
         return entity.id
 
     async def create_many(self, entities: Sequence[ItemEntity]) -> list[UUID]:
-        """Create multiple items, return their IDs"""
-        ids = []
-        for entity in entities:
-            item_id = await self.create(entity)
-            ids.append(item_id)
-        return ids
+        """Create multiple items in a single query, return their IDs"""
+        if not entities:
+            return []
+
+        await self._client.query(
+            f"FOR $row IN $rows {{ CREATE item CONTENT {_ITEM_CONTENT}; }}",
+            {"rows": [self._to_params(e) for e in entities]},
+        )
+        return [e.id for e in entities]
 
     async def get(self, item_id: UUID) -> Optional[ItemEntity]:
         """Get item by ID"""
@@ -257,10 +254,13 @@ class SurrealItemRepository(ItemRepository):
         from ....entity_resolution import resolve_entity
 
         canonical = resolve_entity(subject)
+        # Condition order picks the index: EXPLAIN on embedded SurrealDB 2.x
+        # iterates the last indexed condition's index, so the selective
+        # canonical_subject lookup goes last (see test_item_lookups_use_selective_index)
         result = await self._client.query(
             """
             SELECT * FROM item
-            WHERE canonical_subject = $canonical AND status = $status AND meta_about = NONE
+            WHERE status = $status AND meta_about = NONE AND canonical_subject = $canonical
             ORDER BY created_at DESC
             """,
             {"canonical": canonical, "status": status},
@@ -317,9 +317,9 @@ class SurrealItemRepository(ItemRepository):
         result = await self._client.query(
             f"""
             SELECT * FROM item
-            WHERE canonical_subject = $canonical
+            WHERE status = 'active'
                 AND predicate = $predicate
-                AND status = 'active'
+                AND canonical_subject = $canonical
                 {exclude_clause}
             """,
             params,
@@ -481,7 +481,7 @@ class SurrealItemRepository(ItemRepository):
         result = await self._client.query(
             """
             SELECT * FROM item
-            WHERE meta_about = type::thing("item", $id) AND status = 'active'
+            WHERE status = 'active' AND meta_about = type::thing("item", $id)
             ORDER BY created_at DESC
             """,
             {"id": str(item_id)},
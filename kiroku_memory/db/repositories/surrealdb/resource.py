@@ -2,8 +2,8 @@
 
 from __future__ import annotations
 
-from datetime import datetime
-from typing import TYPE_CHECKING, Optional
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Optional, Sequence
 from uuid import UUID
 
 from ...entities import ResourceEntity
@@ -13,6 +13,16 @@ if TYPE_CHECKING:
     from surrealdb import AsyncSurreal
 
 
+# Record body shared by create() and create_many(); fields come from $row
+_RESOURCE_CONTENT = """{
+    id: type::thing("resource", $row.uuid),
+    created_at: <datetime>$row.created_at,
+    source: $row.source,
+    content: $row.content,
+    metadata: $row.metadata
+}"""
+
+
 class SurrealResourceRepository(ResourceRepository):
     """SurrealDB implementation using SurrealQL"""
 
@@ -51,30 +61,39 @@ class SurrealResourceRepository(ResourceRepository):
             metadata=record.get("metadata", {}),
         )
 
+    def _to_params(self, entity: ResourceEntity) -> dict:
+        """Convert domain entity to query parameters for _RESOURCE_CONTENT"""
+        # Store the entity's own time (as naive UTC) so callers can report it
+        created_at = entity.created_at
+        if created_at.tzinfo is not None:
+            created_at = created_at.astimezone(timezone.utc).replace(tzinfo=None)
+        return {
+            "uuid": str(entity.id),
+            "created_at": created_at.isoformat() + "Z",
+            "source": entity.source,
+            "content": entity.content,
+            "metadata": entity.metadata,
+        }
+
     async def create(self, entity: ResourceEntity) -> UUID:
         """Create a new resource, return its ID"""
-        uuid_str = str(entity.id)
-
-        result = await self._client.query(
-            """
-            CREATE resource CONTENT {
-                id: type::thing("resource", $uuid),
-                created_at: time::now(),
-                source: $source,
-                content: $content,
-                metadata: $metadata
-            }
-            """,
-            {
-                "uuid": uuid_str,
-                "source": entity.source,
-                "content": entity.content,
-                "metadata": entity.metadata,
-            },
+        await self._client.query(
+            f"CREATE resource CONTENT {_RESOURCE_CONTENT}",
+            {"row": self._to_params(entity)},
         )
-
         return entity.id
 
+    async def create_many(self, entities: Sequence[ResourceEntity]) -> list[UUID]:
+        """Create multiple resources in a single query, return their IDs"""
+        if not entities:
+            return []
+
+        await self._client.query(
+            f"FOR $row IN $rows {{ CREATE resource CONTENT {_RESOURCE_CONTENT}; }}",
+            {"rows": [self._to_params(e) for e in entities]},
+        )
+        return [e.id for e in entities]
+
     async def get(self, resource_id: UUID) -> Optional[ResourceEntity]:
         """Get resource by ID"""
         from surrealdb import RecordID
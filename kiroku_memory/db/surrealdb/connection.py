@@ -10,6 +10,8 @@ from typing import TYPE_CHECKING, AsyncGenerator, Optional
 if TYPE_CHECKING:
     from surrealdb import AsyncSurreal
 
+SCHEMA_PATH = Path(__file__).parent / "schema.surql"
+
 
 class SurrealConnection:
     """
@@ -97,11 +99,10 @@ class SurrealConnection:
         client = await self.connect()
 
         # Load schema file
-        schema_path = Path(__file__).parent / "schema.surql"
-        if not schema_path.exists():
-            raise FileNotFoundError(f"Schema file not found: {schema_path}")
+        if not SCHEMA_PATH.exists():
+            raise FileNotFoundError(f"Schema file not found: {SCHEMA_PATH}")
 
-        schema_sql = schema_path.read_text()
+        schema_sql = SCHEMA_PATH.read_text()
 
         # Execute schema (SurrealDB handles idempotent DEFINE statements)
         await client.query(schema_sql)
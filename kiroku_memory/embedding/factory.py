@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+from collections import OrderedDict
 from typing import Optional
 
 from .base import EmbeddingProvider
@@ -10,6 +11,11 @@ from .base import EmbeddingProvider
 # Singleton cache for providers
 _provider_cache: dict[str, EmbeddingProvider] = {}
 
+# Recently generated vectors keyed by (provider, model, dimensions, text).
+# Re-extracted facts and repeated search queries skip the provider call.
+EMBEDDING_CACHE_SIZE = 256
+_embedding_cache: OrderedDict[tuple, tuple[float, ...]] = OrderedDict()
+
 
 def get_embedding_provider(
     provider: Optional[str] = None,
@@ -62,8 +68,9 @@ def get_embedding_provider(
 
 
 def clear_provider_cache() -> None:
-    """Clear the provider cache (useful for testing)"""
+    """Clear the provider and embedding caches (useful for testing)"""
     _provider_cache.clear()
+    _embedding_cache.clear()
 
 
 async def generate_embedding(
@@ -85,14 +92,25 @@ async def generate_embedding(
     from ..db.config import settings
 
     embedding_provider = get_embedding_provider(provider)
-    result = await embedding_provider.embed_text(text)
+    storage_dim = settings.embedding_dimensions
 
+    key = (embedding_provider.name, embedding_provider.model_name, adapt_to_dim, storage_dim, text)
+    cached = _embedding_cache.get(key)
+    if cached is not None:
+        _embedding_cache.move_to_end(key)
+        return list(cached)
+
+    result = await embedding_provider.embed_text(text)
+    vector = result.vector
     if adapt_to_dim:
-        return embedding_provider.adapt_vector(result.vector, adapt_to_dim)
+        vector = embedding_provider.adapt_vector(vector, adapt_to_dim)
+    elif len(vector) != storage_dim:
+        # Default adaptation to configured storage dimension
+        vector = embedding_provider.adapt_vector(vector, storage_dim)
 
-    # Default adaptation to configured storage dimension
-    storage_dim = settings.embedding_dimensions
-    if len(result.vector) != storage_dim:
-        return embedding_provider.adapt_vector(result.vector, storage_dim)
+    # Stored as a tuple so no caller can mutate the cached vector
+    _embedding_cache[key] = tuple(vector)
+    if len(_embedding_cache) > EMBEDDING_CACHE_SIZE:
+        _embedding_cache.popitem(last=False)
 
-    return result.vector
+    return vector
@@ -129,4 +129,5 @@ class LocalEmbeddingProvider(EmbeddingProvider):
         """Synchronous batch embedding"""
         model = self._ensure_model()
         embeddings = model.encode(texts, convert_to_numpy=True)
-        return [emb.tolist() for emb in embeddings]
+        # One tolist() on the 2-D array instead of a Python loop over rows
+        return embeddings.tolist()
@@ -2,17 +2,18 @@
 
 from __future__ import annotations
 
-import re
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Mapping
 
 
 def normalize_entity(text: str) -> str:
     """Basic normalization: lowercase, strip, collapse whitespace."""
-    text = text.strip().lower()
-    text = re.sub(r"\s+", " ", text)
-    return text
+    # split() with no separator strips and collapses runs of whitespace
+    return " ".join(text.lower().split())
 
 
-BUILTIN_ALIASES: dict[str, str] = {
+_ALIAS_SOURCE: dict[str, str] = {
     # User self-references
     "我": "user",
     "i": "user",
@@ -41,8 +42,19 @@ BUILTIN_ALIASES: dict[str, str] = {
     "win": "windows",
 }
 
+# Normalized once at import and read-only, so lookups on normalized input can
+# never miss a mis-cased entry and cached resolve_entity results stay valid
+BUILTIN_ALIASES: Mapping[str, str] = MappingProxyType({
+    normalize_entity(alias): normalize_entity(canonical)
+    for alias, canonical in _ALIAS_SOURCE.items()
+})
 
+
+@lru_cache(maxsize=16384)
 def resolve_entity(text: str) -> str:
-    """Normalize + alias lookup → canonical form."""
+    """Normalize + alias lookup → canonical form.
+
+    Pure and called for every subject/object on ingest, so results are cached.
+    """
     normalized = normalize_entity(text)
     return BUILTIN_ALIASES.get(normalized, normalized)
@@ -150,27 +150,43 @@ async def extract_and_store(
 
         # Auto-generate embeddings (best-effort, skip if no provider)
         try:
-            from .embedding.factory import generate_embedding, get_embedding_provider
+            from .embedding.factory import get_embedding_provider
             provider = get_embedding_provider()
-            for entity, item_id in zip(entities, item_ids):
-                text = provider.build_text_for_item(
+            storage_dim = settings.embedding_dimensions
+
+            # One embedding request and one write for all extracted items
+            texts = [
+                provider.build_text_for_item(
                     entity.subject, entity.predicate, entity.object, entity.category
                 )
-                vector = await generate_embedding(text)
-                await uow.embeddings.upsert(item_id, vector)
+                for entity in entities
+            ]
+            results = await provider.embed_batch(texts)
+
+            embeddings: dict[UUID, list[float]] = {}
+            for item_id, result in zip(item_ids, results):
+                vec = result.vector
+                if len(vec) != storage_dim:
+                    vec = provider.adapt_vector(vec, storage_dim)
+                embeddings[item_id] = vec
+
+            await uow.embeddings.batch_upsert(embeddings)
         except Exception:
             pass  # Embedding generation is best-effort
 
-        # Create extraction_method meta-facts (best-effort)
-        for item_id in item_ids:
-            try:
-                await uow.items.create_meta_fact(
-                    about_item_id=item_id,
+        # Create extraction_method meta-facts in one write (best-effort)
+        try:
+            await uow.items.create_many([
+                ItemEntity(
                     predicate="extraction_method",
-                    object_value="gpt-4o-mini",
+                    object="gpt-4o-mini",
+                    category="meta",
+                    meta_about=item_id,
                 )
-            except Exception:
-                pass
+                for item_id in item_ids
+            ])
+        except Exception:
+            pass
 
         return item_ids
 
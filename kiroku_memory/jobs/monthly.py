@@ -1,5 +1,6 @@
 """Monthly re-indexing job - Recompute embeddings, reweight graph edges"""
 
+import asyncio
 from datetime import datetime
 from uuid import UUID
 
@@ -10,6 +11,7 @@ from ..db.entities import GraphEdgeEntity
 async def recompute_all_embeddings(
     uow: UnitOfWork,
     batch_size: int = 50,
+    max_concurrency: int = 4,
 ) -> dict:
     """
     Recompute embeddings for all active items.
@@ -17,6 +19,7 @@ async def recompute_all_embeddings(
     Args:
         uow: Unit of work
         batch_size: Items per batch
+        max_concurrency: Embedding requests allowed in flight at once
 
     Returns:
         Statistics dict
@@ -26,9 +29,8 @@ async def recompute_all_embeddings(
 
     stats = {"processed": 0, "errors": 0}
 
-    # Get all active items (exclude meta items)
-    all_items = await uow.items.list(status="active", limit=100000)
-    items = [it for it in all_items if it.meta_about is None]
+    # Active items; list() already excludes meta items in the query
+    items = await uow.items.list(status="active", limit=100000)
 
     if not items:
         return stats
@@ -36,29 +38,41 @@ async def recompute_all_embeddings(
     provider = get_embedding_provider()
     storage_dim = settings.embedding_dimensions
 
-    # Process in batches
-    for i in range(0, len(items), batch_size):
-        batch = items[i : i + batch_size]
-        try:
-            texts = [
-                provider.build_text_for_item(
-                    it.subject, it.predicate, it.object, it.category
-                )
-                for it in batch
-            ]
-            results = await provider.embed_batch(texts)
-
-            embeddings: dict[UUID, list[float]] = {}
-            for item, result in zip(batch, results):
-                vec = result.vector
-                if len(vec) != storage_dim:
-                    vec = provider.adapt_vector(vec, storage_dim)
-                embeddings[item.id] = vec
-
-            await uow.embeddings.batch_upsert(embeddings)
-            stats["processed"] += len(batch)
-        except Exception:
-            stats["errors"] += len(batch)
+    limit = asyncio.Semaphore(max_concurrency)
+
+    async def embed(batch):
+        texts = [
+            provider.build_text_for_item(
+                it.subject, it.predicate, it.object, it.category
+            )
+            for it in batch
+        ]
+        async with limit:
+            return await provider.embed_batch(texts)
+
+    # Embedding requests for up to max_concurrency batches run concurrently;
+    # writes stay sequential, in batch order, as each batch's vectors arrive
+    batches = [items[i : i + batch_size] for i in range(0, len(items), batch_size)]
+    tasks = [asyncio.ensure_future(embed(batch)) for batch in batches]
+    try:
+        for batch, task in zip(batches, tasks):
+            try:
+                results = await task
+
+                embeddings: dict[UUID, list[float]] = {}
+                for item, result in zip(batch, results):
+                    vec = result.vector
+                    if len(vec) != storage_dim:
+                        vec = provider.adapt_vector(vec, storage_dim)
+                    embeddings[item.id] = vec
+
+                await uow.embeddings.batch_upsert(embeddings)
+                stats["processed"] += len(batch)
+            except Exception:
+                stats["errors"] += len(batch)
+    finally:
+        for task in tasks:
+            task.cancel()
 
     return stats
 
@@ -2,6 +2,7 @@
 
 from collections import defaultdict
 from datetime import datetime
+from typing import Optional
 
 from ..db.repositories.base import UnitOfWork
 from ..db.entities import ItemEntity, GraphEdgeEntity
@@ -76,32 +77,52 @@ def _build_adjacency(
     Returns:
         dict mapping entity -> [(neighbor_entity, edge_weight, distance)]
     """
-    # 1-hop direct neighbors
-    direct: dict[str, list[tuple[str, float]]] = defaultdict(list)
+    # 1-hop direct neighbors, deduplicated (first edge weight wins).
+    # Parallel edges between the same pair would otherwise be rescanned
+    # once each during 2-hop expansion.
+    direct: dict[str, dict[str, float]] = {}
     for edge in edges:
-        direct[edge.subject].append((edge.object, edge.weight))
-        direct[edge.object].append((edge.subject, edge.weight))
+        direct.setdefault(edge.subject, {}).setdefault(edge.object, edge.weight)
+        direct.setdefault(edge.object, {}).setdefault(edge.subject, edge.weight)
 
     # Build result with distance info
-    adjacency: dict[str, list[tuple[str, float, int]]] = defaultdict(list)
+    adjacency: dict[str, list[tuple[str, float, int]]] = {}
 
     for entity, neighbors in direct.items():
-        seen = {entity}
         # 1-hop
-        for neighbor, weight in neighbors:
-            if neighbor not in seen:
-                adjacency[entity].append((neighbor, weight, 1))
-                seen.add(neighbor)
+        entries = [(n, w, 1) for n, w in neighbors.items() if n != entity]
 
         # 2-hop (if max_depth >= 2)
         if max_depth >= 2:
-            for neighbor, _ in neighbors:
-                for hop2, weight2, in direct.get(neighbor, []):
+            seen = neighbors.keys() | {entity}
+            for neighbor in neighbors:
+                for hop2, weight2 in direct[neighbor].items():
                     if hop2 not in seen:
-                        adjacency[entity].append((hop2, weight2, 2))
+                        entries.append((hop2, weight2, 2))
                         seen.add(hop2)
 
-    return dict(adjacency)
+        if entries:
+            adjacency[entity] = entries
+
+    return adjacency
+
+
+def _neighbor_signal(
+    neighbors: list[tuple[str, float, int]], entity_confidence: dict[str, float]
+) -> Optional[float]:
+    """Distance-discounted weighted average of neighbor confidence, or None"""
+    total_weight = 0.0
+    weighted_sum = 0.0
+    for neighbor_entity, edge_weight, distance in neighbors:
+        if neighbor_entity not in entity_confidence:
+            continue
+        w = edge_weight * DISTANCE_DISCOUNT.get(distance, 0.0)
+        weighted_sum += entity_confidence[neighbor_entity] * w
+        total_weight += w
+
+    if total_weight == 0:
+        return None
+    return weighted_sum / total_weight
 
 
 async def propagate_confidence(uow: UnitOfWork) -> int:
@@ -137,35 +158,29 @@ async def propagate_confidence(uow: UnitOfWork) -> int:
         if eitems:
             entity_confidence[entity] = sum(i.confidence for i in eitems) / len(eitems)
 
+    # Neighbor signal depends only on the entity, so compute it once per
+    # entity rather than once per item sharing that entity
+    neighbor_signals: dict[str, float] = {}
+    for entity in entity_items:
+        neighbors = adjacency.get(entity)
+        if not neighbors:
+            continue
+        signal = _neighbor_signal(neighbors, entity_confidence)
+        if signal is not None:
+            neighbor_signals[entity] = signal
+
+    keep = 1 - PROPAGATION_STRENGTH
     updated = 0
     for item in items:
         if item.meta_about is not None:
             continue
 
         canonical = item.canonical_subject or item.canonical_object
-        if not canonical or canonical not in adjacency:
-            continue
-
-        neighbors = adjacency[canonical]
-        if not neighbors:
-            continue
-
-        # Weighted average of neighbor confidence
-        total_weight = 0.0
-        weighted_sum = 0.0
-        for neighbor_entity, edge_weight, distance in neighbors:
-            if neighbor_entity not in entity_confidence:
-                continue
-            discount = DISTANCE_DISCOUNT.get(distance, 0.0)
-            w = edge_weight * discount
-            weighted_sum += entity_confidence[neighbor_entity] * w
-            total_weight += w
-
-        if total_weight == 0:
+        neighbor_signal = neighbor_signals.get(canonical) if canonical else None
+        if neighbor_signal is None:
             continue
 
-        neighbor_signal = weighted_sum / total_weight
-        new_confidence = item.confidence * (1 - PROPAGATION_STRENGTH) + neighbor_signal * PROPAGATION_STRENGTH
+        new_confidence = item.confidence * keep + neighbor_signal * PROPAGATION_STRENGTH
         new_confidence = max(0.1, min(1.0, new_confidence))
 
         if abs(new_confidence - item.confidence) < MIN_CHANGE_THRESHOLD:
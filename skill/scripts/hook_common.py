@@ -0,0 +1,249 @@
+"""
+Shared helpers for the Kiroku Memory stop hooks.
+
+Imported by skill/scripts/stop-hook.py, skill/scripts/stop-hook-llm.py and
+hooks/stop-hook.py, so the dedup cache, transcript scanning, API client and
+process spawning behave the same in every hook.
+
+Keep this module cheap to import: hooks run after every response.
+"""
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+from pathlib import Path
+from urllib.parse import urlsplit
+
+try:
+    # Optional: orjson parses and serializes JSON several times faster
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    json_loads = json.loads
+    _json_encode = json.JSONEncoder(separators=(",", ":")).encode
+
+    def json_dumps(obj) -> bytes:
+        """Compact JSON as bytes, like orjson.dumps."""
+        return _json_encode(obj).encode("utf-8")
+
+KIROKU_API = os.environ.get("KIROKU_API", "http://localhost:8000")
+CACHE_DIR = Path.home() / ".cache" / "kiroku-memory"
+CACHE_FILE = CACHE_DIR / "recent_saves.json"
+DEDUP_HOURS = 24
+MAX_PARALLEL_POSTS = 5  # Concurrent API requests when saving several memories
+MAX_TRACKED_TRANSCRIPTS = 50  # Per-transcript scan offsets kept in the cache
+TRANSCRIPT_BUFFER_SIZE = 128 * 1024  # Large read buffer for sequential transcript scans
+
+# Quoted role literals; every message entry in a transcript carries one
+MESSAGE_ROLES = (b'"user"', b'"assistant"')
+
+
+def get_project_name(cwd: str) -> str:
+    """Extract project name from cwd (same result as os.path.basename)."""
+    if cwd:
+        if os.altsep:
+            cwd = cwd.replace(os.altsep, os.sep)
+        return cwd.rpartition(os.sep)[2]
+    return None
+
+
+# ============ Dedup cache ============
+
+
+def load_recent_saves() -> dict:
+    """Load recently saved content hashes."""
+    try:
+        if CACHE_FILE.exists():
+            with open(CACHE_FILE, "rb") as f:
+                return json_loads(f.read())
+    except Exception:
+        pass
+    return {"saves": [], "last_cleanup": datetime.now().isoformat()}
+
+
+def save_recent_saves(data: dict):
+    """Save recent content hashes.
+
+    Written to a temp file and renamed into place, so a crash mid-write
+    never leaves a truncated file behind.
+    """
+    tmp = CACHE_FILE.with_name(f"{CACHE_FILE.name}.{os.getpid()}.tmp")
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        with open(tmp, "wb") as f:
+            f.write(json_dumps(data))
+        os.replace(tmp, CACHE_FILE)
+    except Exception:
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
+
+
+def content_hash(content: str, source: str) -> str:
+    """Generate hash for deduplication (128-bit, same width as the old md5 keys)."""
+    return hashlib.blake2b(f"{source}:{content}".encode(), digest_size=16).hexdigest()
+
+
+def index_recent_saves(recent: dict, now: float) -> dict:
+    """Drop entries expired as of now and return a hash -> timestamp index of live saves."""
+    cutoff = now - (DEDUP_HOURS * 3600)
+    kept = []
+    live = {}
+    for s in recent["saves"]:
+        ts = s.get("ts", 0)
+        if ts > cutoff:
+            kept.append(s)
+            live[s.get("hash")] = ts
+    recent["saves"] = kept
+    return live
+
+
+def is_duplicate(content: str, source: str, live: dict) -> bool:
+    """Check if content was recently saved."""
+    return content_hash(content, source) in live
+
+
+def mark_saved(content: str, source: str, recent: dict, live: dict, now: float):
+    """Mark content as saved at now (persisted later via save_recent_saves)."""
+    h = content_hash(content, source)
+    live[h] = now
+    recent["saves"].append({"hash": h, "ts": now})
+
+
+def get_transcript_offset(recent: dict, transcript_path: str) -> int:
+    """Byte offset up to which this transcript was already scanned.
+
+    Falls back to 0 if the transcript is missing or shrank since then.
+    """
+    offset = recent.get("offsets", {}).get(transcript_path, 0)
+    try:
+        if offset > os.path.getsize(transcript_path):
+            return 0
+    except OSError:
+        return 0
+    return offset
+
+
+def set_transcript_offset(recent: dict, transcript_path: str, offset: int):
+    """Record the scanned offset, keeping only the most recent transcripts."""
+    offsets = recent.setdefault("offsets", {})
+    offsets.pop(transcript_path, None)
+    offsets[transcript_path] = offset
+    while len(offsets) > MAX_TRACKED_TRANSCRIPTS:
+        del offsets[next(iter(offsets))]
+
+
+# ============ Transcript entries ============
+
+
+def may_be_message(line: bytes, roles: tuple = MESSAGE_ROLES) -> bool:
+    """Cheap pre-check on a raw transcript line before JSON-decoding it.
+
+    Message entries always carry their quoted role literal, so most other
+    lines are never decoded.
+    """
+    return any(role in line for role in roles)
+
+
+def extract_text_from_entry(entry: dict) -> str:
+    """Extract text content from a transcript entry.
+
+    Exact type() checks are safe here: the JSON decoder only produces
+    plain dict/str objects.
+    """
+    msg = entry.get("message", {})
+    if type(msg) is dict:
+        return next(
+            (c.get("text", "").strip() for c in msg.get("content", [])
+             if type(c) is dict and c.get("type") == "text"),
+            "",
+        )
+    if type(msg) is str:
+        return msg.strip()
+    return ""
+
+
+# ============ Kiroku API ============
+
+_API_URL = urlsplit(KIROKU_API)
+_api_local = threading.local()  # One keep-alive connection per thread
+
+
+class APIStatusError(Exception):
+    """Non-2xx response from the Kiroku API."""
+
+    def __init__(self, path: str, status: int):
+        super().__init__(f"POST {path} returned HTTP {status}")
+        self.status = status
+
+
+def close_api():
+    """Close this thread's API connection, if open."""
+    conn = getattr(_api_local, "conn", None)
+    if conn is not None:
+        conn.close()
+        _api_local.conn = None
+
+
+def api_post(path: str, payload: dict, timeout: float = 5) -> bytes:
+    """POST JSON to the Kiroku API over a reused keep-alive connection.
+
+    Raises APIStatusError on non-2xx responses and the underlying error on
+    connection failures.
+    """
+    import http.client  # Deferred: only needed once there is something to send
+
+    body = json_dumps(payload)
+    headers = {"Content-Type": "application/json"}
+
+    while True:
+        conn = getattr(_api_local, "conn", None)
+        reused = conn is not None
+        if not reused:
+            conn_cls = (http.client.HTTPSConnection if _API_URL.scheme == "https"
+                        else http.client.HTTPConnection)
+            conn = _api_local.conn = conn_cls(_API_URL.hostname, _API_URL.port, timeout=timeout)
+        elif conn.sock is not None:
+            conn.sock.settimeout(timeout)
+
+        try:
+            conn.request("POST", _API_URL.path.rstrip("/") + path, body=body, headers=headers)
+            resp = conn.getresponse()
+            data = resp.read()
+        except (http.client.RemoteDisconnected, ConnectionResetError, BrokenPipeError):
+            close_api()
+            if reused:
+                continue  # Server dropped the idle connection, retry on a fresh one
+            raise
+        except Exception:
+            close_api()
+            raise
+
+        if resp.status >= 300:
+            raise APIStatusError(path, resp.status)
+        return data
+
+
+# ============ Background processes ============
+
+
+def spawn_detached(args: list):
+    """Start a detached background process with stdout/stderr discarded.
+
+    Uses posix_spawn where available, which skips forking this
+    interpreter's address space; falls back to subprocess elsewhere.
+    """
+    try:
+        devnull = [(os.POSIX_SPAWN_OPEN, fd, os.devnull, os.O_WRONLY, 0) for fd in (1, 2)]
+        os.posix_spawn(args[0], args, os.environ, file_actions=devnull, setsid=True)
+    except (AttributeError, NotImplementedError):
+        import subprocess
+
+        subprocess.Popen(
+            args,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,  # Detach from parent
+        )
@@ -15,7 +15,18 @@ import sys
 import subprocess
 from datetime import datetime, timedelta
 from pathlib import Path
-from hashlib import md5
+from hashlib import blake2b
+
+try:
+    # Optional: orjson parses and serializes JSON several times faster
+    from orjson import dumps as json_dumps, loads as json_loads
+except ImportError:
+    json_loads = json.loads
+    _json_encode = json.JSONEncoder(separators=(",", ":")).encode
+
+    def json_dumps(obj) -> bytes:
+        """Compact JSON as bytes, like orjson.dumps."""
+        return _json_encode(obj).encode("utf-8")
 
 # === Configuration ===
 MIN_INTERVAL_SECONDS = 300  # 5 minutes minimum between captures
@@ -23,6 +34,7 @@ MIN_NEW_MESSAGES = 10  # At least 10 new messages to trigger
 CACHE_DIR = Path.home() / ".cache" / "kiroku-memory"
 THROTTLE_FILE = CACHE_DIR / "throttle-state.json"
 LOG_FILE = CACHE_DIR / "post-tool-hook.log"
+TRANSCRIPT_BUFFER_SIZE = 128 * 1024  # Large read buffer for sequential transcript scans
 
 # API endpoint
 KIROKU_API = os.environ.get("KIROKU_API", "http://localhost:8000")
@@ -41,38 +53,51 @@ def log(message: str):
 
 def get_session_key(transcript_path: str) -> str:
     """Generate a unique key for this session based on transcript path."""
-    return md5(transcript_path.encode()).hexdigest()[:12]
+    return blake2b(transcript_path.encode(), digest_size=6).hexdigest()
 
 
 def load_throttle_state() -> dict:
     """Load throttle state from cache."""
     try:
         if THROTTLE_FILE.exists():
-            with open(THROTTLE_FILE) as f:
-                return json.load(f)
+            with open(THROTTLE_FILE, "rb") as f:
+                return json_loads(f.read())
     except Exception:
         pass
     return {"sessions": {}}
 
 
 def save_throttle_state(state: dict):
-    """Save throttle state to cache."""
+    """Save throttle state to cache.
+
+    Written to a temp file and renamed into place, so a crash mid-write
+    never leaves a truncated file behind.
+    """
+    tmp = THROTTLE_FILE.with_name(f"{THROTTLE_FILE.name}.{os.getpid()}.tmp")
     try:
         CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        with open(THROTTLE_FILE, "w") as f:
-            json.dump(state, f)
+        with open(tmp, "wb") as f:
+            f.write(json_dumps(state))
+        os.replace(tmp, THROTTLE_FILE)
     except Exception:
-        pass
+        try:
+            tmp.unlink()
+        except OSError:
+            pass
 
 
 def count_messages(transcript_path: str) -> int:
     """Count user and assistant messages in transcript."""
     count = 0
     try:
-        with open(transcript_path) as f:
+        with open(transcript_path, "rb", buffering=TRANSCRIPT_BUFFER_SIZE) as f:
             for line in f:
+                # Cheap pre-check: message entries always carry one of these
+                # literals, so most other lines are never JSON-decoded
+                if b'"user"' not in line and b'"assistant"' not in line:
+                    continue
                 try:
-                    entry = json.loads(line)
+                    entry = json_loads(line)
                     entry_type = entry.get("type", "")
                     if entry_type in ("user", "assistant"):
                         count += 1
@@ -120,6 +145,24 @@ def get_project_name(cwd: str) -> str:
     return Path(cwd).name
 
 
+def spawn_detached(args: list):
+    """Start a detached background process with stdout/stderr discarded.
+
+    Uses posix_spawn where available, which skips forking this
+    interpreter's address space; falls back to subprocess elsewhere.
+    """
+    try:
+        devnull = [(os.POSIX_SPAWN_OPEN, fd, os.devnull, os.O_WRONLY, 0) for fd in (1, 2)]
+        os.posix_spawn(args[0], args, os.environ, file_actions=devnull, setsid=True)
+    except (AttributeError, NotImplementedError):
+        subprocess.Popen(
+            args,
+            stdout=subprocess.DEVNULL,
+            stderr=subprocess.DEVNULL,
+            start_new_session=True,  # Detach from parent
+        )
+
+
 def spawn_incremental_worker(transcript_path: str, source: str, offset: int):
     """Spawn background worker for incremental memory extraction."""
     try:
@@ -129,18 +172,13 @@ def spawn_incremental_worker(transcript_path: str, source: str, offset: int):
             return
 
         # Pass offset to worker for incremental processing
-        subprocess.Popen(
-            [
-                sys.executable,
-                str(llm_script),
-                "--transcript", transcript_path,
-                "--source", source,
-                "--offset", str(offset),
-            ],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            start_new_session=True,  # Fully detach from parent
-        )
+        spawn_detached([
+            sys.executable,
+            str(llm_script),
+            "--transcript", transcript_path,
+            "--source", source,
+            "--offset", str(offset),
+        ])
         log(f"Spawned incremental worker with offset={offset}")
     except Exception as e:
         log(f"Failed to spawn worker: {e}")
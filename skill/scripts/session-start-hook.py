@@ -9,11 +9,16 @@ to stdout, which Claude Code will inject into the conversation context.
 import json
 import os
 import sys
+import time
 import urllib.request
 import urllib.error
+from pathlib import Path
 
 KIROKU_API = os.environ.get("KIROKU_API", "http://localhost:8000")
 MAX_CONTEXT_CHARS = int(os.environ.get("KIROKU_MAX_CONTEXT_CHARS", "12000"))  # ~4000 tokens
+CACHE_DIR = Path.home() / ".cache" / "kiroku-memory"
+API_DOWN_FILE = CACHE_DIR / "api_down.ts"
+API_DOWN_GRACE_SECONDS = 30  # Skip the API call while it was recently unreachable
 
 
 def get_project_name():
@@ -53,10 +58,41 @@ def count_categories(context: str) -> int:
     return context.count("### ")
 
 
+def api_recently_down() -> bool:
+    """Check if the API was found unreachable within the grace window."""
+    try:
+        down_since = float(API_DOWN_FILE.read_text())
+        return time.time() - down_since < API_DOWN_GRACE_SECONDS
+    except Exception:
+        return False
+
+
+def mark_api_down():
+    """Record that the API was unreachable."""
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        API_DOWN_FILE.write_text(str(time.time()))
+    except Exception:
+        pass
+
+
+def clear_api_down():
+    """Forget a previously recorded API outage."""
+    try:
+        os.unlink(API_DOWN_FILE)
+    except OSError:
+        pass
+
+
 def main():
+    # API was down moments ago, don't stall the session on another timeout
+    if api_recently_down():
+        sys.exit(0)
+
     try:
         # Fetch global + project context (API handles smart truncation)
         context = fetch_context(max_chars=MAX_CONTEXT_CHARS)
+        clear_api_down()
 
         if not context or context.strip() == "":
             # No memories, exit silently
@@ -75,7 +111,8 @@ def main():
         sys.exit(0)
 
     except urllib.error.URLError:
-        # API not available, silently continue
+        # API not available, remember it and silently continue
+        mark_api_down()
         sys.exit(0)
     except Exception as e:
         # Log error but don't block
@@ -18,26 +18,45 @@ Phase 2 implementation (2026-02-01)
 """
 
 import argparse
-import hashlib
 import json
 import os
 import re
 import subprocess
 import sys
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from datetime import datetime
-from pathlib import Path
 
-KIROKU_API = os.environ.get("KIROKU_API", "http://localhost:8000")
-CACHE_DIR = Path.home() / ".cache" / "kiroku-memory"
-CACHE_FILE = CACHE_DIR / "recent_saves.json"
+from hook_common import (
+    CACHE_DIR,
+    MAX_PARALLEL_POSTS,
+    TRANSCRIPT_BUFFER_SIZE,
+    api_post,
+    close_api,
+    extract_text_from_entry,
+    index_recent_saves,
+    is_duplicate,
+    json_loads,
+    load_recent_saves,
+    mark_saved,
+    may_be_message,
+    save_recent_saves,
+)
+
 LOG_FILE = CACHE_DIR / "llm-worker.log"
-DEDUP_HOURS = 24
 
 # Analysis limits
 MAX_USER_MESSAGES = 10
 MAX_ASSISTANT_MESSAGES = 8
 MAX_MEMORIES = 5
 MAX_TRANSCRIPT_CHARS = 12000  # Limit transcript size for Claude CLI
+USER_MESSAGE_CHARS = 500  # Per-message cap inside the snippet
+ASSISTANT_MESSAGE_CHARS = 1000
+
+# Fallback for responses where the outermost braces don't form valid JSON
+MEMORIES_JSON_RE = re.compile(r'\{[\s\S]*"memories"[\s\S]*\}')
 
 # Claude CLI prompt template - outputs structured SPO format for direct storage
 MEMORY_EXTRACTION_PROMPT = """You are an assistant that extracts durable memories from a conversation.
@@ -89,91 +108,37 @@ def log(message: str):
         pass
 
 
-def load_recent_saves() -> dict:
-    """Load recently saved content hashes (shared with stop-hook.py)."""
-    try:
-        if CACHE_FILE.exists():
-            with open(CACHE_FILE) as f:
-                return json.load(f)
-    except Exception:
-        pass
-    return {"saves": [], "last_cleanup": datetime.now().isoformat()}
-
-
-def save_recent_saves(data: dict):
-    """Save recent content hashes."""
-    try:
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        with open(CACHE_FILE, "w") as f:
-            json.dump(data, f)
-    except Exception:
-        pass
-
-
-def content_hash(content: str, source: str) -> str:
-    """Generate hash for deduplication."""
-    return hashlib.md5(f"{source}:{content}".encode()).hexdigest()
-
-
-def is_duplicate(content: str, source: str, recent: dict) -> bool:
-    """Check if content was recently saved."""
-    h = content_hash(content, source)
-    now = datetime.now()
-
-    # Clean old entries
-    cutoff = now.timestamp() - (DEDUP_HOURS * 3600)
-    recent["saves"] = [
-        s for s in recent["saves"]
-        if s.get("ts", 0) > cutoff
-    ]
-
-    for s in recent["saves"]:
-        if s.get("hash") == h:
-            return True
-    return False
-
-
-def mark_saved(content: str, source: str, recent: dict):
-    """Mark content as saved."""
-    recent["saves"].append({
-        "hash": content_hash(content, source),
-        "ts": datetime.now().timestamp()
-    })
-    save_recent_saves(recent)
-
-
-def extract_text_from_entry(entry: dict) -> str:
-    """Extract text content from a transcript entry."""
-    msg = entry.get("message", {})
-    if isinstance(msg, dict):
-        content_list = msg.get("content", [])
-        for c in content_list:
-            if isinstance(c, dict) and c.get("type") == "text":
-                return c.get("text", "").strip()
-    elif isinstance(msg, str):
-        return msg.strip()
-    return ""
-
+def parse_transcript(
+    transcript_path: str,
+    offset: int = 0,
+    max_user: int = MAX_USER_MESSAGES,
+    max_assistant: int = MAX_ASSISTANT_MESSAGES,
+) -> tuple[list, list]:
+    """Parse transcript and extract the most recent user/assistant messages.
 
-def parse_transcript(transcript_path: str, offset: int = 0) -> tuple[list, list]:
-    """Parse transcript and extract user/assistant messages.
+    Messages are kept in bounded ring buffers, so memory stays flat no
+    matter how long the transcript grows.
 
     Args:
         transcript_path: Path to the transcript JSONL file
         offset: Skip first N messages (for incremental processing)
+        max_user: Keep only the last N user messages
+        max_assistant: Keep only the last N assistant messages
 
     Returns:
         tuple: (user_messages, assistant_messages)
     """
-    user_messages = []
-    assistant_messages = []
+    user_messages = deque(maxlen=max_user)
+    assistant_messages = deque(maxlen=max_assistant)
     message_count = 0
 
     try:
-        with open(transcript_path) as f:
+        with open(transcript_path, "rb", buffering=TRANSCRIPT_BUFFER_SIZE) as f:
             for line in f:
+                if not may_be_message(line):
+                    continue
                 try:
-                    entry = json.loads(line)
+                    entry = json_loads(line)
                     entry_type = entry.get("type", "")
 
                     if entry_type not in ("user", "assistant"):
@@ -199,42 +164,46 @@ def parse_transcript(transcript_path: str, offset: int = 0) -> tuple[list, list]
     except Exception as e:
         log(f"Error parsing transcript: {e}")
 
-    return user_messages, assistant_messages
+    return list(user_messages), list(assistant_messages)
+
+
+def _clip(msg: str, cap: int) -> str:
+    """Truncate a single message to cap chars, marking the cut."""
+    return msg if len(msg) <= cap else f"{msg[:cap]}..."
 
 
 def build_transcript_snippet(user_messages: list, assistant_messages: list) -> str:
     """Build a condensed transcript snippet for Claude CLI.
 
-    Takes last N messages from each role and interleaves them.
+    Takes last N messages from each role and interleaves them. Stops
+    formatting messages once MAX_TRANSCRIPT_CHARS is reached.
     """
     # Take last N from each
     recent_user = user_messages[-MAX_USER_MESSAGES:]
     recent_assistant = assistant_messages[-MAX_ASSISTANT_MESSAGES:]
 
-    # Build interleaved conversation
-    lines = []
-
-    # Add user messages
-    for i, msg in enumerate(recent_user):
-        # Truncate very long messages
-        if len(msg) > 500:
-            msg = msg[:500] + "..."
-        lines.append(f"[User {i+1}]: {msg}")
-
-    # Add assistant messages (summaries of key parts)
-    for i, msg in enumerate(recent_assistant):
-        # Truncate very long messages
-        if len(msg) > 1000:
-            msg = msg[:1000] + "..."
-        lines.append(f"[Assistant {i+1}]: {msg}")
-
-    snippet = "\n\n".join(lines)
+    # Build interleaved conversation: user messages, then assistant
+    # messages (summaries of key parts), each truncated if very long
+    lines = chain(
+        (f"[User {i+1}]: {_clip(msg, USER_MESSAGE_CHARS)}"
+         for i, msg in enumerate(recent_user)),
+        (f"[Assistant {i+1}]: {_clip(msg, ASSISTANT_MESSAGE_CHARS)}"
+         for i, msg in enumerate(recent_assistant)),
+    )
 
-    # Final truncation if needed
-    if len(snippet) > MAX_TRANSCRIPT_CHARS:
-        snippet = snippet[:MAX_TRANSCRIPT_CHARS] + "\n...(truncated)"
+    parts = []
+    total = 0
+    for line in lines:
+        piece = f"\n\n{line}" if parts else line
+        if total + len(piece) > MAX_TRANSCRIPT_CHARS:
+            # Budget exhausted - keep the prefix that fits and stop
+            parts.append(piece[:MAX_TRANSCRIPT_CHARS - total])
+            parts.append("\n...(truncated)")
+            break
+        parts.append(piece)
+        total += len(piece)
 
-    return snippet
+    return "".join(parts)
 
 
 def call_claude_cli(prompt: str) -> dict | None:
@@ -244,9 +213,11 @@ def call_claude_cli(prompt: str) -> dict | None:
         dict with memories array, or None on failure
     """
     try:
-        # Use claude CLI with JSON output
+        # Use claude CLI with JSON output; the prompt goes over stdin so a
+        # long transcript never runs into argv size limits
         result = subprocess.run(
-            ["claude", "-p", prompt, "--output-format", "json"],
+            ["claude", "-p", "--output-format", "json"],
+            input=prompt,
             capture_output=True,
             text=True,
             timeout=60  # 60 second timeout
@@ -262,7 +233,7 @@ def call_claude_cli(prompt: str) -> dict | None:
         # Claude CLI --output-format json wraps response in:
         # {"type":"result", "result": "actual response text", ...}
         try:
-            wrapper = json.loads(output)
+            wrapper = json_loads(output)
             if isinstance(wrapper, dict) and "result" in wrapper:
                 # Extract the actual response from the wrapper
                 response_text = wrapper.get("result", "")
@@ -274,10 +245,21 @@ def call_claude_cli(prompt: str) -> dict | None:
             log("Failed to parse wrapper, using raw output")
 
         # Try to extract memories JSON from the response
-        # Claude might wrap it in markdown code blocks
-        json_match = re.search(r'\{[\s\S]*"memories"[\s\S]*\}', response_text)
+        # Claude might wrap it in markdown code blocks or surround it with
+        # prose, so take the span from the first "{" to the last "}"
+        start = response_text.find("{")
+        end = response_text.rfind("}")
+        if start >= 0 and end > start:
+            candidate = response_text[start:end + 1]
+            if '"memories"' in candidate:
+                try:
+                    return json_loads(candidate)
+                except json.JSONDecodeError:
+                    pass
+
+        json_match = MEMORIES_JSON_RE.search(response_text)
         if json_match:
-            data = json.loads(json_match.group())
+            data = json_loads(json_match.group())
             return data
 
         # Log actual response for debugging
@@ -300,9 +282,6 @@ def call_claude_cli(prompt: str) -> dict | None:
 
 def store_memory_item(subject: str, predicate: str, obj: str, category: str, confidence: float) -> bool:
     """Store memory via POST /v2/items (no OpenAI required)."""
-    import urllib.request
-    import urllib.error
-
     try:
         payload = {
             "subject": subject,
@@ -312,22 +291,31 @@ def store_memory_item(subject: str, predicate: str, obj: str, category: str, con
             "confidence": confidence,
         }
 
-        data = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(
-            f"{KIROKU_API}/v2/items",
-            data=data,
-            headers={"Content-Type": "application/json"},
-            method="POST"
-        )
-
-        with urllib.request.urlopen(req, timeout=10) as resp:
-            return True
+        api_post("/v2/items", payload, timeout=10)
+        return True
 
     except Exception as e:
         log(f"Store error: {e}")
         return False
 
 
+def _store_one(item: tuple) -> bool:
+    """Store one pending memory on this worker thread's connection."""
+    _, subject, predicate, obj, category, confidence = item
+    try:
+        return store_memory_item(subject, predicate, obj, category, confidence)
+    finally:
+        close_api()
+
+
+def store_all(items: list) -> list:
+    """Store pending memories concurrently; returns success flags in input order."""
+    if not items:
+        return []
+    with ThreadPoolExecutor(max_workers=min(len(items), MAX_PARALLEL_POSTS)) as pool:
+        return list(pool.map(_store_one, items))
+
+
 def main():
     parser = argparse.ArgumentParser(description="LLM-based memory extraction")
     parser.add_argument("--transcript", required=True, help="Path to transcript JSONL")
@@ -376,11 +364,14 @@ def main():
     memories = result.get("memories", [])
     log(f"Claude extracted {len(memories)} memories")
 
-    # Load dedup cache
+    # Load dedup cache (one timestamp for the whole run)
+    now = time.time()
     recent = load_recent_saves()
+    live = index_recent_saves(recent, now)
 
-    # Store each memory via POST /v2/items
-    saved_count = 0
+    # Pick memories worth storing
+    pending = []
+    pending_keys = set()
     for memory in memories:
         subject = memory.get("subject", "").strip()
         predicate = memory.get("predicate", "").strip()
@@ -399,15 +390,26 @@ def main():
 
         # Check duplicate using subject+predicate+object as content
         content_key = f"{subject} {predicate} {obj}"
-        if is_duplicate(content_key, args.source, recent):
+        if content_key in pending_keys or is_duplicate(content_key, args.source, live):
             log(f"Duplicate skipped: {content_key[:50]}")
             continue
 
-        # Store via /v2/items
-        if store_memory_item(subject, predicate, obj, category, confidence):
-            mark_saved(content_key, args.source, recent)
-            saved_count += 1
-            log(f"Saved ({category}): {subject} {predicate} {obj[:30]}")
+        pending_keys.add(content_key)
+        pending.append((content_key, subject, predicate, obj, category, confidence))
+
+    # Store via /v2/items (requests are independent, send them concurrently)
+    saved_count = 0
+    try:
+        for item, ok in zip(pending, store_all(pending)):
+            if ok:
+                content_key, subject, predicate, obj, category, _ = item
+                mark_saved(content_key, args.source, recent, live, now)
+                saved_count += 1
+                log(f"Saved ({category}): {subject} {predicate} {obj[:30]}")
+    finally:
+        # Persist once, even if a later memory blew up
+        if saved_count:
+            save_recent_saves(recent)
 
     log(f"LLM analysis complete: {saved_count} memories saved")
     sys.exit(0)
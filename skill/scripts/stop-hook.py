@@ -19,41 +19,60 @@ Phase 1 improvements (2026-02-01):
 - Extended SAVE_PATTERNS for discoveries, decisions, learnings
 """
 
-import hashlib
 import json
 import os
 import re
-import subprocess
 import sys
-import urllib.request
-import urllib.error
-from datetime import datetime
+import tempfile
+import time
+from bisect import bisect_left, bisect_right
+from collections import deque
 from pathlib import Path
 
-KIROKU_API = os.environ.get("KIROKU_API", "http://localhost:8000")
-CACHE_DIR = Path.home() / ".cache" / "kiroku-memory"
-CACHE_FILE = CACHE_DIR / "recent_saves.json"
+from hook_common import (
+    CACHE_DIR,
+    MAX_PARALLEL_POSTS,
+    TRANSCRIPT_BUFFER_SIZE,
+    api_post,
+    close_api,
+    extract_text_from_entry,
+    get_project_name,
+    get_transcript_offset,
+    index_recent_saves,
+    is_duplicate,
+    json_dumps,
+    json_loads,
+    load_recent_saves,
+    mark_saved,
+    may_be_message,
+    save_recent_saves,
+    set_transcript_offset,
+    spawn_detached,
+)
+
 MIN_LENGTH_WITH_PATTERN = 10   # Weighted length threshold when SAVE_PATTERN matched
 MIN_LENGTH_NO_PATTERN = 35     # Weighted length threshold for unmatched content
-DEDUP_HOURS = 24
 MAX_ASSISTANT_MESSAGES = 4     # Only analyze last N assistant messages
 
 # CJK character detection (Chinese, Japanese Hiragana/Katakana)
 CJK_PATTERN = re.compile(r'[\u4e00-\u9fff\u3040-\u309f\u30a0-\u30ff]')
+CJK_WEIGHT = 2.5
 
 
 def weighted_length(content: str) -> float:
     """Calculate weighted length: CJK chars count as 2.5x, others as 1x."""
+    if content.isascii():
+        return float(len(content))  # No CJK possible, skip the regex scan
     cjk_count = len(CJK_PATTERN.findall(content))
     non_cjk = len(content) - cjk_count
-    return cjk_count * 2.5 + non_cjk
+    return cjk_count * CJK_WEIGHT + non_cjk
 
 
 # Patterns that indicate save-worthy content (user messages)
 SAVE_PATTERNS = [
     # Preferences (existing)
-    r"(?:I|我|用戶|user)\s*(?:喜歡|偏好|prefer|like)",
-    r"(?:I|我|用戶|user)\s*(?:不喜歡|討厭|dislike|hate)",
+    r"(?:i|我|用戶|user)\s*(?:喜歡|偏好|prefer|like)",
+    r"(?:i|我|用戶|user)\s*(?:不喜歡|討厭|dislike|hate)",
     # Decisions (existing + new)
     r"(?:決定|decide|chosen?|selected?)",
     r"(?:選擇|採用|choose|adopt)",
@@ -79,13 +98,16 @@ SAVE_PATTERNS = [
     r"(?:原來|it turns out|actually)",
 ]
 
-# Patterns that indicate noise (should NOT save)
+# Noise (should NOT save): plain literals are checked with str methods,
+# which is cheaper than running them through the regex engine
 # Note: Removed "請/please" filter to allow polite requests with valuable content
+NOISE_PREFIXES = ("什麼", "怎麼", "如何", "what", "how", "why", "when", "where")
+NOISE_SUBSTRINGS = ("error", "錯誤", "failed", "失敗")
+
+# Noise that needs a regex (whole-message acknowledgements)
 NOISE_PATTERNS = [
     r"^(?:ok|好的?|是的?|對|沒問題|understood|got it|sure|yes|no)[\s.!]*$",
     r"^(?:謝謝|thanks?|thank you)[\s.!]*$",
-    r"^(?:什麼|怎麼|如何|what|how|why|when|where)\s*(?:是|意思)?",
-    r"(?:error|錯誤|failed|失敗)",
 ]
 
 # Conclusion markers for assistant messages
@@ -110,105 +132,84 @@ CONCLUSION_MARKERS = [
 ]
 
 
-def get_project_name(cwd: str) -> str:
-    """Extract project name from cwd."""
-    if cwd:
-        return os.path.basename(cwd)
-    return None
-
-
-def load_recent_saves() -> dict:
-    """Load recently saved content hashes."""
-    try:
-        if CACHE_FILE.exists():
-            with open(CACHE_FILE) as f:
-                return json.load(f)
-    except Exception:
-        pass
-    return {"saves": [], "last_cleanup": datetime.now().isoformat()}
-
-
-def save_recent_saves(data: dict):
-    """Save recent content hashes."""
-    try:
-        CACHE_DIR.mkdir(parents=True, exist_ok=True)
-        with open(CACHE_FILE, "w") as f:
-            json.dump(data, f)
-    except Exception:
-        pass
-
-
-def content_hash(content: str, source: str) -> str:
-    """Generate hash for deduplication."""
-    return hashlib.md5(f"{source}:{content}".encode()).hexdigest()
-
-
-def is_duplicate(content: str, source: str, recent: dict) -> bool:
-    """Check if content was recently saved."""
-    h = content_hash(content, source)
-    now = datetime.now()
-
-    # Clean old entries
-    cutoff = now.timestamp() - (DEDUP_HOURS * 3600)
-    recent["saves"] = [
-        s for s in recent["saves"]
-        if s.get("ts", 0) > cutoff
-    ]
-
-    # Check for duplicate
-    for s in recent["saves"]:
-        if s.get("hash") == h:
-            return True
-
-    return False
+def _union(patterns: list, flags: int = 0) -> re.Pattern:
+    """Merge patterns into one precompiled alternation (single pass per search).
 
+    Patterns are written in lowercase and matched against lowercased text,
+    so no case folding is needed inside the regex engine.
+    """
+    # An empty list must never match (a bare "" would match everything)
+    return re.compile("|".join(f"(?:{p})" for p in patterns) or "(?!)", flags)
+
+
+SAVE_RE = _union(SAVE_PATTERNS)
+# Anchored noise only needs to look at the start of the message; leading
+# whitespace is skipped here so callers don't need to strip() first
+NOISE_PREFIX_RE = _union([r"\s*" + p[1:] for p in NOISE_PATTERNS if p.startswith("^")])
+NOISE_ANY_RE = _union([p for p in NOISE_PATTERNS if not p.startswith("^")])
+# One regex per marker, tried in list order: a single alternation would let
+# an earlier marker consume an overlapping later one (e.g. 總結 in 總結論).
+# Match offsets slice the original text, so keep case folding here
+CONCLUSION_RES = [re.compile(p, re.IGNORECASE) for p in CONCLUSION_MARKERS]
+SENTENCE_BREAK_RE = re.compile(r"[.。!！?？\n]")
+
+# Subject-predicate-object heuristics, English first, then Chinese
+SPO_PATTERNS = [
+    re.compile(
+        r'^(.+?)\s+(is|are|was|were|has|have|had|likes?|prefers?|wants?|needs?|uses?|works?|lives?|chose|decided?|discovered?)\s+(.+)$',
+        re.IGNORECASE,
+    ),
+    re.compile(r'^(.+?)(是|喜歡|偏好|想要|需要|使用|住在|工作於|選擇|決定|發現|正在)(.+)$'),
+]
 
-def mark_saved(content: str, source: str, recent: dict):
-    """Mark content as saved."""
-    recent["saves"].append({
-        "hash": content_hash(content, source),
-        "ts": datetime.now().timestamp()
-    })
-    save_recent_saves(recent)
+# Category keywords in priority order; anything else (discoveries,
+# decisions, ...) is a fact
+CATEGORY_PATTERNS = [
+    ("preferences", re.compile(r"喜歡|偏好|prefer|like|favorite")),
+    ("goals", re.compile(r"想要|目標|goal|want|plan")),
+]
 
 
 def should_save(content: str) -> bool:
     """Determine if content is worth saving.
 
-    Pattern-first, weighted-length-second approach:
-    1. Reject noise patterns immediately
-    2. Calculate weighted length (CJK chars count as 2.5x)
-    3. If SAVE_PATTERN matched → lower threshold
-    4. No pattern matched → higher threshold
+    Cheapest checks first:
+    1. Reject content too short to reach any threshold, even if all CJK
+    2. Reject content whose weighted length (CJK chars count as 2.5x) is
+       below the lower threshold, before any regex runs
+    3. Reject noise patterns
+    4. Weighted length >= higher threshold → save
+    5. Between the thresholds → save only if a SAVE_PATTERN matches
+
+    SAVE_PATTERNS only lower the threshold, so the save regex is only run
+    for content whose length falls between the two thresholds.
     """
-    content_lower = content.lower().strip()
-    w_len = weighted_length(content)
+    # 1. Weighted length never exceeds CJK_WEIGHT * len(content)
+    if len(content) * CJK_WEIGHT < MIN_LENGTH_WITH_PATTERN:
+        return False
 
-    # 1. Check noise patterns first - reject immediately
-    for pattern in NOISE_PATTERNS:
-        if re.search(pattern, content_lower, re.IGNORECASE):
-            return False
+    # 2. Too short for either threshold
+    w_len = weighted_length(content)
+    if w_len < MIN_LENGTH_WITH_PATTERN:
+        return False
 
-    # 2. Check save patterns - if matched, use lower threshold
-    for pattern in SAVE_PATTERNS:
-        if re.search(pattern, content_lower, re.IGNORECASE):
-            return w_len >= MIN_LENGTH_WITH_PATTERN
+    text = content.lower()
 
-    # 3. No pattern matched - use higher threshold
-    return w_len >= MIN_LENGTH_NO_PATTERN
+    # 3. Check noise patterns - reject immediately
+    if (
+        text.lstrip().startswith(NOISE_PREFIXES)
+        or any(s in text for s in NOISE_SUBSTRINGS)
+        or NOISE_PREFIX_RE.match(text)
+        or NOISE_ANY_RE.search(text)
+    ):
+        return False
 
+    # 4. Long enough without any pattern
+    if w_len >= MIN_LENGTH_NO_PATTERN:
+        return True
 
-def extract_text_from_entry(entry: dict) -> str:
-    """Extract text content from a transcript entry."""
-    msg = entry.get("message", {})
-    if isinstance(msg, dict):
-        content_list = msg.get("content", [])
-        for c in content_list:
-            if isinstance(c, dict) and c.get("type") == "text":
-                return c.get("text", "").strip()
-    elif isinstance(msg, str):
-        return msg.strip()
-    return ""
+    # 5. Shorter content needs a save pattern to qualify
+    return SAVE_RE.search(text) is not None
 
 
 def extract_conclusion_snippets(text: str, max_length: int = 200) -> list:
@@ -218,26 +219,25 @@ def extract_conclusion_snippets(text: str, max_length: int = 200) -> list:
     Each snippet is trimmed to max_length characters around the marker.
     """
     snippets = []
-    text_lower = text.lower()
+    # Sentence break positions, found once and binary-searched per marker
+    breaks = [m.start() for m in SENTENCE_BREAK_RE.finditer(text)]
 
-    for marker_pattern in CONCLUSION_MARKERS:
-        matches = list(re.finditer(marker_pattern, text_lower, re.IGNORECASE))
-        for match in matches:
+    # Markers in priority order, each with all of its matches
+    for pattern in CONCLUSION_RES:
+        for match in pattern.finditer(text):
             start = match.start()
             # Find sentence boundaries around the marker
-            # Look backwards for sentence start
+            # Look backwards (up to 100 chars) for sentence start
             sentence_start = max(0, start - 100)
-            for i in range(start - 1, sentence_start, -1):
-                if text[i] in '.。!！?？\n':
-                    sentence_start = i + 1
-                    break
+            i = bisect_right(breaks, start - 1)
+            if i and breaks[i - 1] > sentence_start:
+                sentence_start = breaks[i - 1] + 1
 
             # Look forward for sentence end
             sentence_end = min(len(text), start + max_length)
-            for i in range(start + len(match.group()), sentence_end):
-                if i < len(text) and text[i] in '.。!！?？\n':
-                    sentence_end = i + 1
-                    break
+            i = bisect_left(breaks, match.end())
+            if i < len(breaks) and breaks[i] < sentence_end:
+                sentence_end = breaks[i] + 1
 
             snippet = text[sentence_start:sentence_end].strip()
             if snippet and len(snippet) > 15:  # Minimum meaningful length
@@ -257,21 +257,30 @@ def extract_conclusion_snippets(text: str, max_length: int = 200) -> list:
     return unique_snippets
 
 
-def extract_saveable_content(transcript_path: str) -> list:
-    """Extract save-worthy content from transcript.
+def extract_saveable_content(transcript_path: str, offset: int = 0) -> tuple[list, int]:
+    """Extract save-worthy content from transcript, starting at byte offset.
+
+    Returns the candidates and the offset just past the last complete line.
 
     Analyzes both user and assistant messages:
     - User messages: Apply SAVE_PATTERNS matching
     - Assistant messages: Extract conclusion marker snippets from last N messages
     """
     user_candidates = []
-    assistant_entries = []
+    assistant_entries = deque(maxlen=MAX_ASSISTANT_MESSAGES)
+    end = offset
 
     try:
-        with open(transcript_path) as f:
+        with open(transcript_path, "rb", buffering=TRANSCRIPT_BUFFER_SIZE) as f:
+            f.seek(offset)
             for line in f:
+                if not line.endswith(b"\n"):
+                    break  # Entry still being written, pick it up next run
+                end += len(line)
+                if not may_be_message(line):
+                    continue
                 try:
-                    entry = json.loads(line)
+                    entry = json_loads(line)
                     entry_type = entry.get("type", "")
 
                     if entry_type == "user":
@@ -291,7 +300,7 @@ def extract_saveable_content(transcript_path: str) -> list:
 
     # Process last N assistant messages for conclusion markers
     assistant_candidates = []
-    for text in assistant_entries[-MAX_ASSISTANT_MESSAGES:]:
+    for text in assistant_entries:
         snippets = extract_conclusion_snippets(text)
         for snippet in snippets:
             if weighted_length(snippet) >= MIN_LENGTH_WITH_PATTERN:
@@ -311,7 +320,7 @@ def extract_saveable_content(transcript_path: str) -> list:
         if len(unique) >= 5:
             break
 
-    return list(reversed(unique))
+    return list(reversed(unique)), end
 
 
 def parse_content_to_spo(content: str) -> dict:
@@ -321,29 +330,8 @@ def parse_content_to_spo(content: str) -> dict:
     """
     content = content.strip()
 
-    # Common verb patterns (English)
-    en_patterns = [
-        r'^(.+?)\s+(is|are|was|were|has|have|had|likes?|prefers?|wants?|needs?|uses?|works?|lives?|chose|decided?|discovered?)\s+(.+)$',
-    ]
-
-    # Common verb patterns (Chinese)
-    zh_patterns = [
-        r'^(.+?)(是|喜歡|偏好|想要|需要|使用|住在|工作於|選擇|決定|發現|正在)(.+)$',
-    ]
-
-    # Try English patterns
-    for pattern in en_patterns:
-        match = re.match(pattern, content, re.IGNORECASE)
-        if match:
-            return {
-                "subject": match.group(1).strip(),
-                "predicate": match.group(2).strip(),
-                "object": match.group(3).strip(),
-            }
-
-    # Try Chinese patterns
-    for pattern in zh_patterns:
-        match = re.match(pattern, content)
+    for pattern in SPO_PATTERNS:
+        match = pattern.match(content)
         if match:
             return {
                 "subject": match.group(1).strip(),
@@ -360,16 +348,11 @@ def parse_content_to_spo(content: str) -> dict:
 
 
 def detect_category(content: str) -> str:
-    """Auto-detect category from content."""
-    content_lower = content.lower()
-    if any(w in content_lower for w in ["喜歡", "偏好", "prefer", "like", "favorite"]):
-        return "preferences"
-    elif any(w in content_lower for w in ["想要", "目標", "goal", "want", "plan"]):
-        return "goals"
-    elif any(w in content_lower for w in ["發現", "discover", "found", "learned"]):
-        return "facts"
-    elif any(w in content_lower for w in ["決定", "decide", "chose", "選擇"]):
-        return "facts"
+    """Auto-detect category from content (preferences > goals > facts)."""
+    text = content.lower()
+    for category, pattern in CATEGORY_PATTERNS:
+        if pattern.search(text):
+            return category
     return "facts"
 
 
@@ -387,21 +370,98 @@ def ingest_memory(content: str, source: str, role: str = "user") -> bool:
             "confidence": 0.8 if role == "assistant" else 1.0,
         }
 
-        data = json.dumps(payload).encode("utf-8")
-        req = urllib.request.Request(
-            f"{KIROKU_API}/v2/items",
-            data=data,
-            headers={"Content-Type": "application/json"},
-            method="POST"
-        )
+        api_post("/v2/items", payload)
+        return True
+
+    except Exception:
+        return False
+
 
-        with urllib.request.urlopen(req, timeout=5) as resp:
-            return True
+def _ingest_one(candidate: tuple, source: str) -> bool:
+    """Ingest a (role, content) candidate on this worker thread's connection."""
+    role, content = candidate
+    try:
+        return ingest_memory(content, source, role)
+    finally:
+        close_api()
+
+
+def ingest_all(candidates: list, source: str) -> list:
+    """Ingest candidates concurrently; returns success flags in input order."""
+    if not candidates:
+        return []
+    from concurrent.futures import ThreadPoolExecutor
+
+    with ThreadPoolExecutor(max_workers=min(len(candidates), MAX_PARALLEL_POSTS)) as pool:
+        return list(pool.map(_ingest_one, candidates, [source] * len(candidates)))
 
+
+def spawn_ingest_worker(candidates: list, source: str, transcript_path: str,
+                        offset: int, end: int) -> bool:
+    """Hand candidates to a detached copy of this script for ingestion.
+
+    The hook returns without waiting on the API; the worker records what
+    was saved and advances the transcript offset. Returns False if the
+    worker could not be started.
+    """
+    job_path = None
+    try:
+        CACHE_DIR.mkdir(parents=True, exist_ok=True)
+        fd, job_path = tempfile.mkstemp(prefix="ingest-", suffix=".json", dir=CACHE_DIR)
+        with os.fdopen(fd, "wb") as f:
+            f.write(json_dumps({
+                "source": source,
+                "candidates": candidates,
+                "transcript_path": transcript_path,
+                "offset": offset,
+                "end": end,
+            }))
+        spawn_detached([sys.executable, str(Path(__file__).resolve()), "--ingest", job_path])
+        return True
     except Exception:
+        if job_path:
+            try:
+                os.unlink(job_path)
+            except OSError:
+                pass
         return False
 
 
+def run_ingest_worker(job_path: str):
+    """Background entry point: ingest candidates written by spawn_ingest_worker."""
+    try:
+        with open(job_path, "rb") as f:
+            job = json_loads(f.read())
+        os.unlink(job_path)
+    except Exception:
+        return
+    source = job.get("source", "global:user")
+    candidates = [tuple(c) for c in job.get("candidates", [])]
+    results = ingest_all(candidates, source)
+
+    # Reload the cache: other hook runs may have written it meanwhile
+    now = time.time()
+    recent = load_recent_saves()
+    live = index_recent_saves(recent, now)
+    changed = False
+    for (role, content), ok in zip(candidates, results):
+        if ok:
+            mark_saved(content, source, recent, live, now)
+            changed = True
+
+    # Only skip past this chunk once everything in it was stored, and never
+    # move back behind an offset a later run already recorded
+    transcript_path = job.get("transcript_path")
+    end = job.get("end", 0)
+    if transcript_path and False not in results:
+        if recent.get("offsets", {}).get(transcript_path, 0) < end:
+            set_transcript_offset(recent, transcript_path, end)
+            changed = True
+
+    if changed:
+        save_recent_saves(recent)
+
+
 def spawn_llm_worker(transcript_path: str, source: str):
     """Spawn async LLM worker for deep analysis (Phase 2).
 
@@ -414,17 +474,12 @@ def spawn_llm_worker(transcript_path: str, source: str):
             return
 
         # Spawn detached subprocess
-        subprocess.Popen(
-            [
-                sys.executable,
-                str(llm_script),
-                "--transcript", transcript_path,
-                "--source", source
-            ],
-            stdout=subprocess.DEVNULL,
-            stderr=subprocess.DEVNULL,
-            start_new_session=True,  # Detach from parent
-        )
+        spawn_detached([
+            sys.executable,
+            str(llm_script),
+            "--transcript", transcript_path,
+            "--source", source
+        ])
     except Exception:
         # Silently fail - don't block the hook
         pass
@@ -444,22 +499,27 @@ def main():
         project = get_project_name(cwd)
         source = f"project:{project}" if project else "global:user"
 
-        # Load recent saves for deduplication
+        # Load recent saves for deduplication (one timestamp for the whole run)
+        now = time.time()
         recent = load_recent_saves()
+        live = index_recent_saves(recent, now)
 
         # === Phase 1: Fast path (regex-based) ===
-        # Extract saveable content (now includes assistant conclusions)
-        candidates = extract_saveable_content(transcript_path)
-
-        # Save each candidate
-        saved_count = 0
-        for role, content in candidates:
-            if is_duplicate(content, source, recent):
-                continue
-
-            if ingest_memory(content, source, role):
-                mark_saved(content, source, recent)
-                saved_count += 1
+        # Extract saveable content appended since the last run
+        # (now includes assistant conclusions)
+        offset = get_transcript_offset(recent, transcript_path)
+        candidates, end = extract_saveable_content(transcript_path, offset)
+
+        # Save new candidates in a background worker so the hook doesn't
+        # wait on the API. The worker marks them saved and advances the
+        # offset once its POSTs succeed; if it can't start, nothing changes
+        # and the next run retries this chunk
+        pending = [c for c in candidates if not is_duplicate(c[1], source, live)]
+        if pending:
+            spawn_ingest_worker(pending, source, transcript_path, offset, end)
+        elif end != offset:
+            set_transcript_offset(recent, transcript_path, end)
+            save_recent_saves(recent)
 
         # === Phase 2: Slow path (async LLM analysis) ===
         # Spawn background worker for deep analysis
@@ -475,4 +535,7 @@ def main():
 
 
 if __name__ == "__main__":
-    main()
+    if sys.argv[1:2] == ["--ingest"] and len(sys.argv) > 2:
+        run_ingest_worker(sys.argv[2])
+    else:
+        main()
@@ -0,0 +1,109 @@
+"""Shared test fixtures"""
+
+from __future__ import annotations
+
+from contextlib import asynccontextmanager
+
+import pytest
+import pytest_asyncio
+
+from kiroku_memory.db.surrealdb.connection import SCHEMA_PATH
+
+# Tables emptied by surreal_reset
+SURREAL_TABLES = (
+    "resource",
+    "item",
+    "category",
+    "category_access",
+    "graph_edge",
+    "knows",
+    "relates_to",
+)
+
+
+@pytest.fixture(scope="session")
+def surreal_schema() -> str:
+    """SurrealDB schema (schema.surql), read once per test session"""
+    return SCHEMA_PATH.read_text() if SCHEMA_PATH.exists() else ""
+
+
+@pytest.fixture(scope="session")
+def surreal_instance(surreal_schema):
+    """Factory for schema-initialized SurrealDB clients
+
+    Usage: ``async with surreal_instance() as client: ...``
+    Callers skip on a missing surrealdb package themselves.
+    """
+
+    @asynccontextmanager
+    async def connect():
+        from surrealdb import AsyncSurreal
+
+        # In-memory engine: nothing on disk, every client starts empty
+        client = AsyncSurreal("memory://")
+        await client.connect()
+        try:
+            await client.use("test", "test")
+            if surreal_schema:
+                await client.query(surreal_schema)
+            yield client
+        finally:
+            await client.close()
+
+    return connect
+
+
+@pytest.fixture(scope="session")
+def surreal_reset():
+    """Async function emptying every table, for clients shared across tests"""
+    statement = "".join(f"DELETE {table};" for table in SURREAL_TABLES)
+
+    async def reset(client) -> None:
+        await client.query(statement)
+
+    return reset
+
+
+@pytest_asyncio.fixture(scope="session")
+async def surreal_client(surreal_instance):
+    """Schema-initialized SurrealDB client shared by the whole session"""
+    pytest.importorskip("surrealdb")
+
+    async with surreal_instance() as client:
+        yield client
+
+
+@pytest_asyncio.fixture
+async def surreal_uow(surreal_client, surreal_reset):
+    """SurrealDB Unit of Work on the session client; tables are emptied afterwards"""
+    from kiroku_memory.db.repositories.surrealdb import SurrealUnitOfWork
+
+    yield SurrealUnitOfWork(surreal_client)
+
+    await surreal_reset(surreal_client)
+
+
+@pytest_asyncio.fixture(scope="session")
+async def api_client():
+    """HTTP client for the FastAPI app on in-memory SurrealDB, shared by the session"""
+    pytest.importorskip("surrealdb")
+
+    from httpx import AsyncClient, ASGITransport
+
+    from kiroku_memory.api import app
+    from kiroku_memory.db.config import settings
+    from kiroku_memory.db.surrealdb.connection import SurrealConnection
+
+    # Point the shared settings object at the test backend instead of reloading config
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(settings, "backend", "surrealdb")
+        mp.setattr(settings, "surreal_url", "memory://")
+        SurrealConnection.reset_instance()
+
+        transport = ASGITransport(app=app)
+        try:
+            async with AsyncClient(transport=transport, base_url="http://test") as client:
+                yield client
+        finally:
+            await SurrealConnection.get_instance().disconnect()
+            SurrealConnection.reset_instance()
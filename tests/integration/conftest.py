@@ -3,8 +3,6 @@
 from __future__ import annotations
 
 import os
-import tempfile
-from pathlib import Path
 from typing import AsyncGenerator
 
 import pytest
@@ -12,9 +10,9 @@ import pytest_asyncio
 
 from sqlalchemy.ext.asyncio import (
     AsyncSession,
-    async_sessionmaker,
     create_async_engine,
 )
+from sqlalchemy.pool import NullPool
 
 from kiroku_memory.db.config import settings
 from kiroku_memory.db.models import Base
@@ -26,36 +24,57 @@ def backend(request):
     return request.param
 
 
+@pytest_asyncio.fixture(scope="module")
+async def surreal_client(surreal_instance) -> AsyncGenerator:
+    """Module-scoped SurrealDB client with the schema applied once"""
+    try:
+        import surrealdb  # noqa: F401
+    except ImportError:
+        # unit_of_work skips the surrealdb backend on its own
+        yield None
+        return
+
+    async with surreal_instance() as client:
+        yield client
+
+
+@pytest_asyncio.fixture(scope="session")
+async def postgres_engine() -> AsyncGenerator:
+    """Session-scoped engine with tables created once"""
+    db_url = os.environ.get("DATABASE_URL")
+    if not db_url:
+        # unit_of_work skips the postgres backend on its own
+        yield None
+        return
+
+    # NullPool: connections are opened on the test's own event loop
+    engine = create_async_engine(db_url, echo=False, poolclass=NullPool)
+
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+
+    yield engine
+
+    await engine.dispose()
+
+
 @pytest_asyncio.fixture
-async def unit_of_work(backend) -> AsyncGenerator:
+async def unit_of_work(backend, surreal_client, surreal_reset, postgres_engine) -> AsyncGenerator:
     """Get a Unit of Work for the specified backend"""
     original_backend = settings.backend
 
     if backend == "surrealdb":
-        # Skip if surrealdb not installed
-        pytest.importorskip("surrealdb")
+        # surreal_client already checked the import once per module
+        if surreal_client is None:
+            pytest.skip("surrealdb not installed")
 
-        from surrealdb import AsyncSurreal
         from kiroku_memory.db.repositories.surrealdb import SurrealUnitOfWork
 
-        # Use temporary directory (each test gets clean slate)
-        with tempfile.TemporaryDirectory() as tmpdir:
-            url = f"file://{tmpdir}/test"
+        # Shared client; tables are emptied after each test for a clean slate
+        uow = SurrealUnitOfWork(surreal_client)
+        yield uow
 
-            client = AsyncSurreal(url)
-            await client.connect()
-            await client.use("test", "test")
-
-            # Initialize schema
-            schema_path = Path(__file__).parent.parent.parent / "kiroku_memory" / "db" / "surrealdb" / "schema.surql"
-            if schema_path.exists():
-                schema_sql = schema_path.read_text()
-                await client.query(schema_sql)
-
-            uow = SurrealUnitOfWork(client)
-            yield uow
-
-            await client.close()
+        await surreal_reset(surreal_client)
 
     elif backend == "postgres":
         # Skip if no database URL configured
@@ -67,31 +86,18 @@ async def unit_of_work(backend) -> AsyncGenerator:
 
         settings.backend = "postgres"
 
-        # Create fresh engine for each test
-        engine = create_async_engine(
-            db_url,
-            echo=False,
-            pool_size=1,
-            max_overflow=0,
-        )
-
-        session_factory = async_sessionmaker(
-            engine,
-            class_=AsyncSession,
-            expire_on_commit=False,
-        )
-
-        # Initialize tables
-        async with engine.begin() as conn:
-            await conn.run_sync(Base.metadata.create_all)
-
-        # Create session for this test
-        async with session_factory() as session:
+        # Join an outer transaction; commits inside the test only release
+        # savepoints and everything is rolled back at teardown
+        async with postgres_engine.connect() as conn:
+            trans = await conn.begin()
+            session = AsyncSession(
+                bind=conn,
+                expire_on_commit=False,
+                join_transaction_mode="create_savepoint",
+            )
             uow = PostgresUnitOfWork(session)
             yield uow
-            await session.rollback()
-
-        # Dispose engine to release connections
-        await engine.dispose()
+            await session.close()
+            await trans.rollback()
 
     settings.backend = original_backend
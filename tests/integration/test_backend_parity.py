@@ -88,15 +88,18 @@ class TestItemOperations:
     async def test_item_filtering(self, unit_of_work, backend):
         """Test item list filtering"""
         # Create items in different categories
-        for cat in ["cat_a", "cat_a", "cat_b"]:
-            item = ItemEntity(
+        items = [
+            ItemEntity(
                 id=uuid4(),
                 subject="test",
                 predicate="is",
                 object=cat,
                 category=cat,
             )
-            await unit_of_work.items.create(item)
+            for cat in ["cat_a", "cat_a", "cat_b"]
+        ]
+        ids = await unit_of_work.items.create_many(items)
+        assert ids == [item.id for item in items]
 
         # Filter by category
         cat_a_items = await unit_of_work.items.list(category="cat_a")
@@ -206,12 +209,9 @@ class TestCategoryAccessOperations:
         """Test category access logging and counting"""
         # Log accesses
         categories = ["prefs", "prefs", "facts", "prefs"]
-        for cat in categories:
-            access = CategoryAccessEntity(
-                id=uuid4(),
-                category=cat,
-            )
-            await unit_of_work.category_accesses.create(access)
+        accesses = [CategoryAccessEntity(id=uuid4(), category=cat) for cat in categories]
+        ids = await unit_of_work.category_accesses.create_many(accesses)
+        assert ids == [access.id for access in accesses]
 
         # Count by category
         counts = await unit_of_work.category_accesses.count_by_category()
@@ -6,6 +6,7 @@ import random
 import string
 
 import pytest
+import pytest_asyncio
 import httpx
 
 
@@ -13,6 +14,7 @@ import httpx
 BASE_URL = "http://localhost:8000"
 NUM_ITEMS = 100
 TARGET_LATENCY_MS = 500
+CONCURRENCY = 16  # In-flight requests; the client keeps this many keep-alive connections busy
 
 
 def random_text(length: int = 50) -> str:
@@ -20,15 +22,18 @@ def random_text(length: int = 50) -> str:
     return "".join(random.choices(string.ascii_letters + " ", k=length))
 
 
-@pytest.fixture(scope="module")
-def event_loop():
-    """Create event loop for module scope"""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
+async def gather_bounded(coros, limit: int = CONCURRENCY) -> list:
+    """Run coroutines concurrently with at most `limit` in flight"""
+    sem = asyncio.Semaphore(limit)
 
+    async def bounded(coro):
+        async with sem:
+            return await coro
 
-@pytest.fixture(scope="module")
+    return await asyncio.gather(*(bounded(c) for c in coros))
+
+
+@pytest_asyncio.fixture(scope="module")
 async def http_client():
     """Create async HTTP client"""
     async with httpx.AsyncClient(base_url=BASE_URL, timeout=30.0) as client:
@@ -41,19 +46,23 @@ async def http_client():
         yield client
 
 
-@pytest.fixture(scope="module")
+@pytest_asyncio.fixture(scope="module")
 async def setup_test_data(http_client):
     """Setup test data via API"""
     print(f"\nCreating {NUM_ITEMS} test items via API...")
     start = time.perf_counter()
 
-    for i in range(NUM_ITEMS):
-        content = f"Test user_{i % 20} likes {random_text(20)} and prefers {random_text(10)}"
-        response = await http_client.post(
+    responses = await gather_bounded(
+        http_client.post(
             "/ingest",
-            json={"content": content, "source": "load_test"}
+            json={
+                "content": f"Test user_{i % 20} likes {random_text(20)} and prefers {random_text(10)}",
+                "source": "load_test",
+            },
         )
-        assert response.status_code == 200
+        for i in range(NUM_ITEMS)
+    )
+    assert all(r.status_code == 200 for r in responses)
 
     elapsed = time.perf_counter() - start
     print(f"Created {NUM_ITEMS} items in {elapsed:.2f}s")
@@ -72,16 +81,15 @@ async def test_health_endpoint(http_client):
 
 @pytest.mark.asyncio
 async def test_retrieve_latency(http_client, setup_test_data):
-    """Test retrieve endpoint latency"""
-    latencies = []
+    """Test retrieve endpoint latency under concurrent load"""
 
-    for _ in range(30):
+    async def timed_retrieve():
         start = time.perf_counter()
         response = await http_client.get("/retrieve", params={"query": "preferences"})
-        elapsed_ms = (time.perf_counter() - start) * 1000
-        latencies.append(elapsed_ms)
-
         assert response.status_code == 200
+        return (time.perf_counter() - start) * 1000
+
+    latencies = await gather_bounded(timed_retrieve() for _ in range(30))
 
     avg_latency = sum(latencies) / len(latencies)
     p95_latency = sorted(latencies)[int(len(latencies) * 0.95)]
@@ -3,13 +3,9 @@
 from __future__ import annotations
 
 import os
-import tempfile
-from pathlib import Path
-from typing import AsyncGenerator
 from uuid import uuid4
 
 import pytest
-import pytest_asyncio
 
 from kiroku_memory.db.entities import (
     ResourceEntity,
@@ -19,9 +15,11 @@ from kiroku_memory.db.entities import (
     CategoryAccessEntity,
 )
 
-
 # Test data fixtures
-@pytest.fixture
+# Module-scoped: repositories never mutate entities and surreal_uow empties
+# the tables after each test, so one set of objects serves every test.
+# Tests that modify an entity work on a dataclasses.replace() copy.
+@pytest.fixture(scope="module")
 def sample_resource() -> ResourceEntity:
     """Create a sample resource entity"""
     return ResourceEntity(
@@ -32,7 +30,7 @@ def sample_resource() -> ResourceEntity:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_items(sample_resource: ResourceEntity) -> list[ItemEntity]:
     """Create sample item entities"""
     return [
@@ -57,7 +55,7 @@ def sample_items(sample_resource: ResourceEntity) -> list[ItemEntity]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_category() -> CategoryEntity:
     """Create a sample category entity"""
     return CategoryEntity(
@@ -67,7 +65,7 @@ def sample_category() -> CategoryEntity:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_graph_edges() -> list[GraphEdgeEntity]:
     """Create sample graph edge entities"""
     return [
@@ -88,15 +86,19 @@ def sample_graph_edges() -> list[GraphEdgeEntity]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_embedding() -> list[float]:
-    """Create a sample embedding vector (1536 dimensions)"""
+    """Create a sample embedding vector (1536 dimensions), built once per run
+
+    Tests must not mutate it. A private RNG keeps the global random state
+    untouched.
+    """
     import random
-    random.seed(42)
-    return [random.random() for _ in range(1536)]
+    rng = random.Random(42)
+    return [rng.random() for _ in range(1536)]
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def sample_category_access() -> CategoryAccessEntity:
     """Create a sample category access entity"""
     return CategoryAccessEntity(
@@ -105,39 +107,3 @@ def sample_category_access() -> CategoryAccessEntity:
         source="context",
     )
 
-
-# SurrealDB fixtures
-@pytest_asyncio.fixture
-async def surreal_client() -> AsyncGenerator:
-    """Create a temporary SurrealDB client for testing"""
-    # Skip if surrealdb not installed
-    pytest.importorskip("surrealdb")
-
-    from surrealdb import AsyncSurreal
-
-    # Use temporary directory for test database
-    with tempfile.TemporaryDirectory() as tmpdir:
-        url = f"file://{tmpdir}/test"
-
-        client = AsyncSurreal(url)
-        await client.connect()
-        await client.use("test", "test")
-
-        # Initialize schema
-        schema_path = Path(__file__).parent.parent.parent / "kiroku_memory" / "db" / "surrealdb" / "schema.surql"
-        if schema_path.exists():
-            schema_sql = schema_path.read_text()
-            await client.query(schema_sql)
-
-        yield client
-
-        await client.close()
-
-
-@pytest_asyncio.fixture
-async def surreal_uow(surreal_client) -> AsyncGenerator:
-    """Create a SurrealDB Unit of Work for testing"""
-    from kiroku_memory.db.repositories.surrealdb import SurrealUnitOfWork
-
-    uow = SurrealUnitOfWork(surreal_client)
-    yield uow
@@ -2,7 +2,9 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
 from datetime import datetime, timedelta, timezone
+from importlib.util import find_spec
 from uuid import uuid4
 
 import pytest
@@ -16,13 +18,13 @@ from kiroku_memory.db.entities import (
 )
 
 
+HAS_SURREAL = find_spec("surrealdb") is not None
+
 # Skip all tests if surrealdb not installed
-pytestmark = pytest.mark.skipif(
-    not pytest.importorskip("surrealdb", reason="surrealdb not installed"),
-    reason="surrealdb not installed",
-)
+pytestmark = pytest.mark.skipif(not HAS_SURREAL, reason="surrealdb not installed")
 
 
+@pytest.mark.xdist_group(name="surreal_resource")
 class TestSurrealResourceRepository:
     """Tests for SurrealResourceRepository"""
 
@@ -40,17 +42,32 @@ class TestSurrealResourceRepository:
         assert retrieved.source == sample_resource.source
         assert retrieved.content == sample_resource.content
 
+    @pytest.mark.asyncio
+    async def test_create_keeps_entity_time(self, surreal_uow):
+        """created_at is stored from the entity, tz-aware values as UTC"""
+        naive = ResourceEntity(created_at=datetime(2024, 1, 2, 3, 4, 5))
+        aware = ResourceEntity(
+            created_at=datetime(2024, 1, 2, 12, 4, 5, tzinfo=timezone(timedelta(hours=9)))
+        )
+        await surreal_uow.resources.create(naive)
+        await surreal_uow.resources.create_many([aware])
+
+        for entity in (naive, aware):
+            retrieved = await surreal_uow.resources.get(entity.id)
+            assert retrieved.created_at.replace(tzinfo=None) == datetime(2024, 1, 2, 3, 4, 5)
+
     @pytest.mark.asyncio
     async def test_list_resources(self, surreal_uow):
         """Test listing resources with filters"""
         # Create multiple resources
-        for i in range(3):
-            entity = ResourceEntity(
+        await surreal_uow.resources.create_many([
+            ResourceEntity(
                 id=uuid4(),
                 source=f"source_{i % 2}",
                 content=f"Content {i}",
             )
-            await surreal_uow.resources.create(entity)
+            for i in range(3)
+        ])
 
         # List all
         all_resources = await surreal_uow.resources.list(limit=10)
@@ -67,6 +84,7 @@ class TestSurrealResourceRepository:
         assert result is None
 
 
+@pytest.mark.xdist_group(name="surreal_item")
 class TestSurrealItemRepository:
     """Tests for SurrealItemRepository"""
 
@@ -103,8 +121,7 @@ class TestSurrealItemRepository:
     @pytest.mark.asyncio
     async def test_list_by_category(self, surreal_uow, sample_items):
         """Test listing items by category"""
-        for item in sample_items:
-            await surreal_uow.items.create(item)
+        await surreal_uow.items.create_many(sample_items)
 
         # List by category
         items = await surreal_uow.items.list(category="preferences")
@@ -113,8 +130,7 @@ class TestSurrealItemRepository:
     @pytest.mark.asyncio
     async def test_count(self, surreal_uow, sample_items):
         """Test counting items"""
-        for item in sample_items:
-            await surreal_uow.items.create(item)
+        await surreal_uow.items.create_many(sample_items)
 
         count = await surreal_uow.items.count()
         assert count == 2
@@ -122,7 +138,28 @@ class TestSurrealItemRepository:
         count_by_category = await surreal_uow.items.count(category="preferences")
         assert count_by_category == 2
 
-
+    @pytest.mark.asyncio
+    @pytest.mark.parametrize(
+        "where, index",
+        [
+            # list_by_subject
+            ("status = 'active' AND meta_about = NONE AND canonical_subject = 'alice'",
+             "idx_item_canonical_subject"),
+            # find_potential_conflicts
+            ("status = 'active' AND predicate = 'likes' AND canonical_subject = 'alice'",
+             "idx_item_canonical_subject"),
+            # get_meta_facts
+            ("status = 'active' AND meta_about = type::thing('item', 'x')",
+             "idx_item_meta_about"),
+        ],
+    )
+    async def test_item_lookups_use_selective_index(self, surreal_client, where, index):
+        """The planner iterates the index of the last indexed condition"""
+        plan = await surreal_client.query(f"SELECT * FROM item WHERE {where} EXPLAIN")
+        assert plan[0]["detail"]["plan"]["index"] == index
+
+
+@pytest.mark.xdist_group(name="surreal_category")
 class TestSurrealCategoryRepository:
     """Tests for SurrealCategoryRepository"""
 
@@ -152,9 +189,9 @@ class TestSurrealCategoryRepository:
         cat_id = await surreal_uow.categories.upsert(sample_category)
         assert cat_id == sample_category.id
 
-        # Update via upsert
-        sample_category.summary = "Updated summary"
-        updated_id = await surreal_uow.categories.upsert(sample_category)
+        # Update via upsert (on a copy; the fixture is shared by the module)
+        updated = replace(sample_category, summary="Updated summary")
+        updated_id = await surreal_uow.categories.upsert(updated)
         assert updated_id == cat_id
 
         # Verify
@@ -162,14 +199,15 @@ class TestSurrealCategoryRepository:
         assert retrieved.summary == "Updated summary"
 
 
+@pytest.mark.xdist_group(name="surreal_graph")
 class TestSurrealGraphRepository:
     """Tests for SurrealGraphRepository"""
 
     @pytest.mark.asyncio
     async def test_create_and_get_by_subject(self, surreal_uow, sample_graph_edges):
         """Test creating and retrieving graph edges"""
-        for edge in sample_graph_edges:
-            await surreal_uow.graph.create(edge)
+        edge_ids = await surreal_uow.graph.create_many(sample_graph_edges)
+        assert edge_ids == [edge.id for edge in sample_graph_edges]
 
         # Get by subject
         edges = await surreal_uow.graph.get_by_subject("user")
@@ -179,8 +217,7 @@ class TestSurrealGraphRepository:
     @pytest.mark.asyncio
     async def test_get_neighbors(self, surreal_uow, sample_graph_edges):
         """Test getting neighbors"""
-        for edge in sample_graph_edges:
-            await surreal_uow.graph.create(edge)
+        await surreal_uow.graph.create_many(sample_graph_edges)
 
         # Get neighbors of dark_mode
         neighbors = await surreal_uow.graph.get_neighbors("dark_mode", depth=1)
@@ -189,8 +226,7 @@ class TestSurrealGraphRepository:
     @pytest.mark.asyncio
     async def test_delete_by_subject(self, surreal_uow, sample_graph_edges):
         """Test deleting edges by subject"""
-        for edge in sample_graph_edges:
-            await surreal_uow.graph.create(edge)
+        await surreal_uow.graph.create_many(sample_graph_edges)
 
         # Delete edges from "user"
         deleted = await surreal_uow.graph.delete_by_subject("user")
@@ -201,6 +237,7 @@ class TestSurrealGraphRepository:
         assert len(edges) == 0
 
 
+@pytest.mark.xdist_group(name="surreal_embedding")
 class TestSurrealEmbeddingRepository:
     """Tests for SurrealEmbeddingRepository"""
 
@@ -223,11 +260,12 @@ class TestSurrealEmbeddingRepository:
     async def test_search(self, surreal_uow, sample_items, sample_embedding):
         """Test vector search"""
         # Create items with embeddings
-        for i, item in enumerate(sample_items):
-            await surreal_uow.items.create(item)
-            # Slightly modify embedding for each item
-            modified_embedding = [v + (i * 0.01) for v in sample_embedding]
-            await surreal_uow.embeddings.upsert(item.id, modified_embedding)
+        await surreal_uow.items.create_many(sample_items)
+        # Slightly modify embedding for each item
+        await surreal_uow.embeddings.batch_upsert({
+            item.id: [v + (i * 0.01) for v in sample_embedding]
+            for i, item in enumerate(sample_items)
+        })
 
         # Search
         results = await surreal_uow.embeddings.search(
@@ -256,6 +294,7 @@ class TestSurrealEmbeddingRepository:
         assert retrieved is None
 
 
+@pytest.mark.xdist_group(name="surreal_category_access")
 class TestSurrealCategoryAccessRepository:
     """Tests for SurrealCategoryAccessRepository"""
 
@@ -273,12 +312,10 @@ class TestSurrealCategoryAccessRepository:
     async def test_count_by_category(self, surreal_uow):
         """Test counting accesses by category"""
         # Create multiple accesses
-        for cat in ["preferences", "preferences", "facts"]:
-            entity = CategoryAccessEntity(
-                id=uuid4(),
-                category=cat,
-            )
-            await surreal_uow.category_accesses.create(entity)
+        await surreal_uow.category_accesses.create_many([
+            CategoryAccessEntity(id=uuid4(), category=cat)
+            for cat in ["preferences", "preferences", "facts"]
+        ])
 
         # Count
         counts = await surreal_uow.category_accesses.count_by_category()
@@ -288,21 +325,16 @@ class TestSurrealCategoryAccessRepository:
     @pytest.mark.asyncio
     async def test_cleanup_old(self, surreal_uow):
         """Test cleaning up old accesses"""
+        now = datetime.now(timezone.utc).replace(tzinfo=None)
+
         # Create old and new accesses
-        old_access = CategoryAccessEntity(
-            id=uuid4(),
-            category="old",
-            accessed_at=datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=30),
-        )
-        new_access = CategoryAccessEntity(
-            id=uuid4(),
-            category="new",
-        )
-        await surreal_uow.category_accesses.create(old_access)
-        await surreal_uow.category_accesses.create(new_access)
+        await surreal_uow.category_accesses.create_many([
+            CategoryAccessEntity(id=uuid4(), category="old", accessed_at=now - timedelta(days=30)),
+            CategoryAccessEntity(id=uuid4(), category="new"),
+        ])
 
         # Cleanup old (older than 7 days)
-        cutoff = datetime.now(timezone.utc).replace(tzinfo=None) - timedelta(days=7)
+        cutoff = now - timedelta(days=7)
         deleted = await surreal_uow.category_accesses.cleanup_old(cutoff)
         assert deleted == 1
 
@@ -2,14 +2,12 @@
 
 from __future__ import annotations
 
-import tempfile
-from pathlib import Path
 from uuid import uuid4
 
 import pytest
-import pytest_asyncio
 
 from kiroku_memory.db.entities import ItemEntity, GraphEdgeEntity
+from kiroku_memory.entity_resolution import resolve_entity
 from kiroku_memory.jobs.weekly import (
     _build_adjacency,
     propagate_confidence,
@@ -18,41 +16,8 @@ from kiroku_memory.jobs.weekly import (
 )
 
 
-@pytest_asyncio.fixture
-async def surreal_uow():
-    """Create SurrealDB UoW with schema initialized"""
-    pytest.importorskip("surrealdb")
-
-    from surrealdb import AsyncSurreal
-    from kiroku_memory.db.repositories.surrealdb import SurrealUnitOfWork
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        url = f"file://{tmpdir}/test"
-        client = AsyncSurreal(url)
-        await client.connect()
-        await client.use("test", "test")
-
-        schema_path = (
-            Path(__file__).parent.parent
-            / "kiroku_memory"
-            / "db"
-            / "surrealdb"
-            / "schema.surql"
-        )
-        if schema_path.exists():
-            schema_sql = schema_path.read_text()
-            await client.query(schema_sql)
-
-        uow = SurrealUnitOfWork(client)
-        yield uow
-
-        await client.close()
-
-
 async def _create_item(uow, subject, confidence=0.5, category="facts", meta_about=None):
     """Helper: create an item and return it"""
-    from kiroku_memory.entity_resolution import resolve_entity
-
     item = ItemEntity(
         id=uuid4(),
         subject=subject if meta_about is None else None,
@@ -69,8 +34,6 @@ async def _create_item(uow, subject, confidence=0.5, category="facts", meta_abou
 
 async def _create_edge(uow, subject, obj, weight=1.0):
     """Helper: create a graph edge"""
-    from kiroku_memory.entity_resolution import resolve_entity
-
     edge = GraphEdgeEntity(
         id=uuid4(),
         subject=resolve_entity(subject),
@@ -82,6 +45,22 @@ async def _create_edge(uow, subject, obj, weight=1.0):
     return edge
 
 
+async def _create_edges(uow, pairs, weight=1.0):
+    """Helper: create graph edges for (subject, object) pairs in one query"""
+    edges = [
+        GraphEdgeEntity(
+            id=uuid4(),
+            subject=resolve_entity(subject),
+            predicate="related_to",
+            object=resolve_entity(obj),
+            weight=weight,
+        )
+        for subject, obj in pairs
+    ]
+    await uow.graph.create_many(edges)
+    return edges
+
+
 # ============ Unit Tests for _build_adjacency ============
 
 
@@ -115,36 +94,36 @@ def test_build_adjacency_no_self_loop():
 
 
 @pytest.mark.asyncio
-async def test_high_confidence_neighbor_boosts(surreal_uow):
-    """High-confidence neighbors should boost a low-confidence item"""
+@pytest.mark.parametrize(
+    "confidence, neighbor_confidence, check, expected_updated",
+    [
+        # Boosted: 0.3 * 0.85 + 0.9 * 0.15 = 0.39
+        pytest.param(0.3, 0.9, lambda c: c > 0.3, 2, id="high_neighbor_boosts"),
+        # Pulled down: 0.9 * 0.85 + 0.1 * 0.15 = 0.78
+        pytest.param(0.9, 0.1, lambda c: c < 0.9, 2, id="low_neighbor_pulls_down"),
+        # Confidence should not drop below 0.1
+        pytest.param(0.1, 0.1, lambda c: c >= 0.1, 0, id="floor"),
+        # Confidence should not exceed 1.0
+        pytest.param(1.0, 1.0, lambda c: c <= 1.0, 0, id="ceiling"),
+        # Blend ≈ 0.5 is below MIN_CHANGE_THRESHOLD, so no update
+        pytest.param(0.5, 0.5, lambda c: c == 0.5, 0, id="skip_small_change"),
+    ],
+)
+async def test_single_neighbor_propagation(
+    surreal_uow, confidence, neighbor_confidence, check, expected_updated
+):
+    """One item linked to one neighbor moves toward the neighbor's confidence"""
     uow = surreal_uow
 
-    item_low = await _create_item(uow, "alpha", confidence=0.3)
-    await _create_item(uow, "beta", confidence=0.9)
+    item = await _create_item(uow, "alpha", confidence=confidence)
+    await _create_item(uow, "beta", confidence=neighbor_confidence)
     await _create_edge(uow, "alpha", "beta")
 
     updated = await propagate_confidence(uow)
-    assert updated >= 1
-
-    refreshed = await uow.items.get(item_low.id)
-    # Should be boosted: 0.3 * 0.85 + 0.9 * 0.15 = 0.39
-    assert refreshed.confidence > 0.3
-
-
-@pytest.mark.asyncio
-async def test_low_confidence_neighbor_pulls_down(surreal_uow):
-    """Low-confidence neighbors should pull down a high-confidence item"""
-    uow = surreal_uow
-
-    item_high = await _create_item(uow, "gamma", confidence=0.9)
-    await _create_item(uow, "delta", confidence=0.1)
-    await _create_edge(uow, "gamma", "delta")
-
-    await propagate_confidence(uow)
+    assert updated == expected_updated
 
-    refreshed = await uow.items.get(item_high.id)
-    # Should be pulled down: 0.9 * 0.85 + 0.1 * 0.15 = 0.78
-    assert refreshed.confidence < 0.9
+    refreshed = await uow.items.get(item.id)
+    assert check(refreshed.confidence)
 
 
 @pytest.mark.asyncio
@@ -170,8 +149,7 @@ async def test_2hop_weaker_influence(surreal_uow):
     item_eps = await _create_item(uow, "epsilon", confidence=0.3)
     await _create_item(uow, "zeta", confidence=0.3)  # intermediate
     await _create_item(uow, "eta", confidence=1.0)  # high conf, 2-hop from epsilon
-    await _create_edge(uow, "epsilon", "zeta")
-    await _create_edge(uow, "zeta", "eta")
+    await _create_edges(uow, [("epsilon", "zeta"), ("zeta", "eta")])
 
     await propagate_confidence(uow)
 
@@ -184,53 +162,6 @@ async def test_2hop_weaker_influence(surreal_uow):
     assert refreshed.confidence < 0.4
 
 
-@pytest.mark.asyncio
-async def test_confidence_floor(surreal_uow):
-    """Confidence should not drop below 0.1"""
-    uow = surreal_uow
-
-    item = await _create_item(uow, "theta", confidence=0.1)
-    await _create_item(uow, "iota", confidence=0.1)
-    await _create_edge(uow, "theta", "iota")
-
-    await propagate_confidence(uow)
-
-    refreshed = await uow.items.get(item.id)
-    assert refreshed.confidence >= 0.1
-
-
-@pytest.mark.asyncio
-async def test_confidence_ceiling(surreal_uow):
-    """Confidence should not exceed 1.0"""
-    uow = surreal_uow
-
-    item = await _create_item(uow, "kappa", confidence=1.0)
-    await _create_item(uow, "lambda_e", confidence=1.0)
-    await _create_edge(uow, "kappa", "lambda_e")
-
-    await propagate_confidence(uow)
-
-    refreshed = await uow.items.get(item.id)
-    assert refreshed.confidence <= 1.0
-
-
-@pytest.mark.asyncio
-async def test_skip_small_change(surreal_uow):
-    """Changes below MIN_CHANGE_THRESHOLD should be skipped"""
-    uow = surreal_uow
-
-    # Item at 0.5, neighbor also ~0.5 → blend ≈ 0.5, no update
-    item = await _create_item(uow, "mu", confidence=0.5)
-    await _create_item(uow, "nu", confidence=0.5)
-    await _create_edge(uow, "mu", "nu")
-
-    updated = await propagate_confidence(uow)
-    assert updated == 0
-
-    refreshed = await uow.items.get(item.id)
-    assert refreshed.confidence == 0.5
-
-
 @pytest.mark.asyncio
 async def test_meta_items_excluded(surreal_uow):
     """Meta-facts should not participate in propagation"""
@@ -259,8 +190,7 @@ async def test_multi_neighbor_weighted_average(surreal_uow):
     item = await _create_item(uow, "omicron", confidence=0.5)
     await _create_item(uow, "pi_e", confidence=0.9)
     await _create_item(uow, "rho", confidence=0.1)
-    await _create_edge(uow, "omicron", "pi_e", weight=1.0)
-    await _create_edge(uow, "omicron", "rho", weight=1.0)
+    await _create_edges(uow, [("omicron", "pi_e"), ("omicron", "rho")], weight=1.0)
 
     await propagate_confidence(uow)
 
@@ -2,49 +2,17 @@
 
 from __future__ import annotations
 
-import tempfile
-from pathlib import Path
+from functools import lru_cache
 from unittest.mock import AsyncMock, MagicMock, patch
 from uuid import uuid4
 
 import pytest
-import pytest_asyncio
 
 from kiroku_memory.db.entities import ItemEntity, GraphEdgeEntity
+from kiroku_memory.entity_resolution import resolve_entity
 from kiroku_memory.embedding.base import EmbeddingResult
 
 
-@pytest_asyncio.fixture
-async def surreal_uow():
-    """Create SurrealDB UoW with schema initialized"""
-    pytest.importorskip("surrealdb")
-
-    from surrealdb import AsyncSurreal
-    from kiroku_memory.db.repositories.surrealdb import SurrealUnitOfWork
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        url = f"file://{tmpdir}/test"
-        client = AsyncSurreal(url)
-        await client.connect()
-        await client.use("test", "test")
-
-        schema_path = (
-            Path(__file__).parent.parent
-            / "kiroku_memory"
-            / "db"
-            / "surrealdb"
-            / "schema.surql"
-        )
-        if schema_path.exists():
-            schema_sql = schema_path.read_text()
-            await client.query(schema_sql)
-
-        uow = SurrealUnitOfWork(client)
-        yield uow
-
-        await client.close()
-
-
 # SurrealDB HNSW index requires 1536 dimensions
 EMBED_DIM = 1536
 
@@ -54,8 +22,9 @@ def _fake_embedding(dim=EMBED_DIM):
     return [0.1] * dim
 
 
+@lru_cache(maxsize=None)
 def _fake_result(dim=EMBED_DIM):
-    """Return a fake EmbeddingResult"""
+    """Return a fake EmbeddingResult, shared per dimension (treat as read-only)"""
     return EmbeddingResult(vector=_fake_embedding(dim), model="test", dimensions=dim)
 
 
@@ -64,19 +33,17 @@ def _mock_provider(dim=EMBED_DIM):
     provider = MagicMock()
     provider.build_text_for_item.return_value = "Subject: Alice | Predicate: likes | Object: Python"
     provider.embed_batch = AsyncMock(
-        side_effect=lambda texts: [_fake_result(dim) for _ in texts]
+        side_effect=lambda texts: [_fake_result(dim)] * len(texts)
     )
     provider.adapt_vector = MagicMock(side_effect=lambda vec, d: vec[:d] + [0.0] * max(0, d - len(vec)))
     provider.dimensions = dim
     return provider
 
 
-async def _create_item(uow, subject="Alice", predicate="likes", obj="Python",
-                       category="preferences", confidence=0.9, meta_about=None):
-    """Helper: create an item"""
-    from kiroku_memory.entity_resolution import resolve_entity
-
-    item = ItemEntity(
+def _make_item(subject="Alice", predicate="likes", obj="Python",
+               category="preferences", confidence=0.9, meta_about=None):
+    """Helper: build an item entity"""
+    return ItemEntity(
         id=uuid4(),
         subject=subject if meta_about is None else None,
         predicate=predicate,
@@ -87,6 +54,11 @@ async def _create_item(uow, subject="Alice", predicate="likes", obj="Python",
         canonical_object=resolve_entity(obj) if obj else None,
         meta_about=meta_about,
     )
+
+
+async def _create_item(uow, **fields):
+    """Helper: create an item"""
+    item = _make_item(**fields)
     await uow.items.create(item)
     return item
 
@@ -106,33 +78,32 @@ async def test_extract_and_store_creates_embeddings(surreal_uow):
          "category": "preferences", "confidence": 0.9},
     ]
 
+    provider = _mock_provider()
+
     with patch("kiroku_memory.extract.extract_facts", new_callable=AsyncMock) as mock_extract, \
-         patch("kiroku_memory.embedding.factory.get_embedding_provider") as mock_get_provider, \
-         patch("kiroku_memory.embedding.factory.generate_embedding", new_callable=AsyncMock) as mock_gen:
+         patch("kiroku_memory.embedding.factory.get_embedding_provider", return_value=provider):
 
         from kiroku_memory.extract import ExtractedFact
         mock_extract.return_value = [ExtractedFact(**f) for f in fake_facts]
-        mock_get_provider.return_value = _mock_provider()
-        mock_gen.return_value = _fake_embedding()
 
-        # Spy on embeddings.upsert
-        original_upsert = surreal_uow.embeddings.upsert
+        # Spy on embeddings.batch_upsert
+        original_batch_upsert = surreal_uow.embeddings.batch_upsert
         upsert_calls = []
-        async def spy_upsert(item_id, vector):
-            upsert_calls.append((item_id, vector))
-            return await original_upsert(item_id, vector)
-        surreal_uow.embeddings.upsert = spy_upsert
+        async def spy_batch_upsert(embeddings):
+            upsert_calls.append(embeddings)
+            return await original_batch_upsert(embeddings)
+        surreal_uow.embeddings.batch_upsert = spy_batch_upsert
 
         from kiroku_memory.extract import extract_and_store
         item_ids = await extract_and_store(surreal_uow, resource.id)
 
         assert len(item_ids) == 1
-        # Embedding should have been generated once per item
-        assert mock_gen.call_count == 1
-        # upsert should have been called with the item_id and vector
+        # All items should be embedded in a single batch request
+        assert provider.embed_batch.call_count == 1
+        # batch_upsert should have been called once with the item_id and vector
         assert len(upsert_calls) == 1
-        assert upsert_calls[0][0] == item_ids[0]
-        assert len(upsert_calls[0][1]) == EMBED_DIM
+        assert list(upsert_calls[0]) == item_ids
+        assert len(upsert_calls[0][item_ids[0]]) == EMBED_DIM
 
     await surreal_uow.commit()
 
@@ -182,19 +153,19 @@ async def test_extract_meta_items_no_embeddings(surreal_uow):
          "category": "skills", "confidence": 0.95},
     ]
 
+    provider = _mock_provider()
+
     with patch("kiroku_memory.extract.extract_facts", new_callable=AsyncMock) as mock_extract, \
-         patch("kiroku_memory.embedding.factory.get_embedding_provider") as mock_get_provider, \
-         patch("kiroku_memory.embedding.factory.generate_embedding", new_callable=AsyncMock) as mock_gen:
+         patch("kiroku_memory.embedding.factory.get_embedding_provider", return_value=provider):
 
         from kiroku_memory.extract import ExtractedFact, extract_and_store
         mock_extract.return_value = [ExtractedFact(**f) for f in fake_facts]
-        mock_get_provider.return_value = _mock_provider()
-        mock_gen.return_value = _fake_embedding()
 
         item_ids = await extract_and_store(surreal_uow, resource.id)
 
-        # Only 1 embedding call (for the normal item, not for meta-facts)
-        assert mock_gen.call_count == 1
+        # Only the normal item is embedded, not the meta-facts
+        assert provider.embed_batch.call_count == 1
+        assert len(provider.embed_batch.call_args.args[0]) == 1
 
         # Meta-fact should exist but have no embedding
         meta_facts = await surreal_uow.items.get_meta_facts(item_ids[0])
@@ -211,8 +182,10 @@ async def test_extract_meta_items_no_embeddings(surreal_uow):
 @pytest.mark.asyncio
 async def test_recompute_all_embeddings(surreal_uow):
     """recompute_all_embeddings should generate embeddings for active items"""
-    await _create_item(surreal_uow, subject="Dave", obj="Rust", category="skills")
-    await _create_item(surreal_uow, subject="Dave", obj="Go", category="skills")
+    await surreal_uow.items.create_many([
+        _make_item(subject="Dave", obj="Rust", category="skills"),
+        _make_item(subject="Dave", obj="Go", category="skills"),
+    ])
     await surreal_uow.commit()
 
     provider = _mock_provider()
@@ -260,8 +233,9 @@ async def test_recompute_skips_meta_items(surreal_uow):
 @pytest.mark.asyncio
 async def test_recompute_batching(surreal_uow):
     """recompute_all_embeddings should process items in batches"""
-    for i in range(5):
-        await _create_item(surreal_uow, subject=f"User{i}", obj=f"Lang{i}")
+    await surreal_uow.items.create_many([
+        _make_item(subject=f"User{i}", obj=f"Lang{i}") for i in range(5)
+    ])
     await surreal_uow.commit()
 
     provider = _mock_provider()
@@ -278,17 +252,86 @@ async def test_recompute_batching(surreal_uow):
         assert provider.embed_batch.call_count == 3
 
 
+@pytest.mark.asyncio
+async def test_recompute_batch_error_isolated(surreal_uow):
+    """A failed embedding batch is counted as errors; other batches still land"""
+    await surreal_uow.items.create_many([
+        _make_item(subject=f"User{i}", obj=f"Lang{i}") for i in range(5)
+    ])
+    await surreal_uow.commit()
+
+    provider = _mock_provider()
+    calls = []
+
+    def embed(texts):
+        calls.append(len(texts))
+        if len(calls) == 2:
+            raise RuntimeError("provider unavailable")
+        return [_fake_result()] * len(texts)
+
+    provider.embed_batch = AsyncMock(side_effect=embed)
+
+    with patch("kiroku_memory.embedding.factory.get_embedding_provider", return_value=provider), \
+         patch("kiroku_memory.db.config.settings") as mock_settings:
+        mock_settings.embedding_dimensions = EMBED_DIM
+
+        from kiroku_memory.jobs.monthly import recompute_all_embeddings
+        stats = await recompute_all_embeddings(surreal_uow, batch_size=2)
+
+        assert calls == [2, 2, 1]
+        assert stats["processed"] == 3
+        assert stats["errors"] == 2
+
+
+@pytest.mark.asyncio
+async def test_recompute_bounded_concurrency(surreal_uow):
+    """Embedding batches overlap, but never beyond max_concurrency"""
+    import asyncio
+
+    await surreal_uow.items.create_many([
+        _make_item(subject=f"User{i}", obj=f"Lang{i}") for i in range(6)
+    ])
+    await surreal_uow.commit()
+
+    provider = _mock_provider()
+    in_flight = 0
+    peak = 0
+
+    async def embed(texts):
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return [_fake_result()] * len(texts)
+
+    provider.embed_batch = AsyncMock(side_effect=embed)
+
+    with patch("kiroku_memory.embedding.factory.get_embedding_provider", return_value=provider), \
+         patch("kiroku_memory.db.config.settings") as mock_settings:
+        mock_settings.embedding_dimensions = EMBED_DIM
+
+        from kiroku_memory.jobs.monthly import recompute_all_embeddings
+        stats = await recompute_all_embeddings(surreal_uow, batch_size=1, max_concurrency=2)
+
+        assert stats == {"processed": 6, "errors": 0}
+        assert peak == 2
+
+
 # ─── Test 7: cleanup_stale_embeddings ───
 
 @pytest.mark.asyncio
 async def test_cleanup_stale_embeddings(surreal_uow):
     """cleanup_stale_embeddings should remove embeddings for archived items"""
-    item1 = await _create_item(surreal_uow, subject="Frank", obj="C++")
-    item2 = await _create_item(surreal_uow, subject="Grace", obj="Haskell")
+    item1 = _make_item(subject="Frank", obj="C++")
+    item2 = _make_item(subject="Grace", obj="Haskell")
+    await surreal_uow.items.create_many([item1, item2])
 
     # Add embeddings for both
-    await surreal_uow.embeddings.upsert(item1.id, _fake_embedding())
-    await surreal_uow.embeddings.upsert(item2.id, _fake_embedding())
+    await surreal_uow.embeddings.batch_upsert({
+        item1.id: _fake_embedding(),
+        item2.id: _fake_embedding(),
+    })
     await surreal_uow.commit()
 
     # Archive item2
@@ -299,7 +342,7 @@ async def test_cleanup_stale_embeddings(surreal_uow):
     deleted = await cleanup_stale_embeddings(surreal_uow)
 
     # item2's embedding should be cleaned up
-    assert deleted >= 1
+    assert deleted == 1
 
     # item1's embedding should remain
     vec1 = await surreal_uow.embeddings.get(item1.id)
@@ -329,3 +372,36 @@ async def test_monthly_pipeline_embeddings(surreal_uow):
 
         assert stats["embeddings"]["processed"] >= 1
         assert stats["embeddings"]["errors"] == 0
+
+
+# ─── Test 9: generate_embedding caches repeated texts ───
+
+@pytest.mark.asyncio
+async def test_generate_embedding_cached():
+    """Repeated texts should reuse the cached vector instead of re-embedding"""
+    from kiroku_memory.embedding.factory import clear_provider_cache, generate_embedding
+
+    provider = _mock_provider()
+    provider.name = "test"
+    provider.model_name = "test"
+    provider.embed_text = AsyncMock(return_value=_fake_result())
+
+    clear_provider_cache()
+    try:
+        with patch("kiroku_memory.embedding.factory.get_embedding_provider", return_value=provider), \
+             patch("kiroku_memory.db.config.settings") as mock_settings:
+            mock_settings.embedding_dimensions = EMBED_DIM
+
+            first = await generate_embedding("Alice likes Python")
+            second = await generate_embedding("Alice likes Python")
+            await generate_embedding("Carol speaks French")
+
+            assert first == second
+            assert provider.embed_text.call_count == 2
+
+            # Callers get their own copy; mutating it leaves the cache intact
+            second[0] = 42.0
+            third = await generate_embedding("Alice likes Python")
+            assert third == first and third is not second
+    finally:
+        clear_provider_cache()
@@ -2,12 +2,9 @@
 
 from __future__ import annotations
 
-import tempfile
-from pathlib import Path
 from uuid import uuid4
 
 import pytest
-import pytest_asyncio
 
 from kiroku_memory.entity_resolution import (
     normalize_entity,
@@ -83,44 +80,19 @@ class TestResolveEntity:
 
 
 class TestBuiltinAliases:
-    def test_all_keys_are_normalized(self):
-        """All alias keys should already be in normalized form"""
-        for key in BUILTIN_ALIASES:
-            assert key == normalize_entity(key), f"Key '{key}' is not normalized"
-
-    def test_all_values_are_normalized(self):
-        """All alias values should be in normalized form"""
-        for key, value in BUILTIN_ALIASES.items():
-            assert value == normalize_entity(value), f"Value '{value}' for key '{key}' is not normalized"
+    def test_all_entries_are_normalized(self):
+        """All alias keys and values should already be in normalized form"""
+        bad = [
+            (key, value)
+            for key, value in BUILTIN_ALIASES.items()
+            if key != normalize_entity(key) or value != normalize_entity(value)
+        ]
+        assert not bad, f"Non-normalized entries: {bad}"
 
 
 # ============ Integration Tests (SurrealDB) ============
 
 
-@pytest_asyncio.fixture
-async def surreal_uow():
-    """Create SurrealDB UoW with schema applied"""
-    pytest.importorskip("surrealdb")
-
-    from surrealdb import AsyncSurreal
-    from kiroku_memory.db.repositories.surrealdb import SurrealUnitOfWork
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        url = f"file://{tmpdir}/test"
-        client = AsyncSurreal(url)
-        await client.connect()
-        await client.use("test", "test")
-
-        schema_path = Path(__file__).parent.parent / "kiroku_memory" / "db" / "surrealdb" / "schema.surql"
-        if schema_path.exists():
-            schema_sql = schema_path.read_text()
-            await client.query(schema_sql)
-
-        uow = SurrealUnitOfWork(client)
-        yield uow
-        await client.close()
-
-
 @pytest.mark.asyncio
 async def test_canonical_fields_on_create(surreal_uow):
     """Creating an item with canonical fields should persist them"""
@@ -0,0 +1,39 @@
+"""Tests for POST /ingest/batch"""
+
+from __future__ import annotations
+
+from datetime import datetime
+
+import pytest
+
+from kiroku_memory.api import MAX_INGEST_BATCH
+
+
+@pytest.mark.asyncio
+async def test_api_ingest_batch(api_client):
+    """POST /ingest/batch stores every item and returns ids in order"""
+    resp = await api_client.post("/ingest/batch", json={"items": [
+        {"content": "I prefer dark mode", "source": "batch:test"},
+        {"content": "Deploys go through staging", "source": "batch:test",
+         "metadata": {"hook": "stop"}},
+    ]})
+    assert resp.status_code == 200
+    data = resp.json()
+    assert len(data) == 2
+
+    for entry, content in zip(data, ["I prefer dark mode", "Deploys go through staging"]):
+        resp = await api_client.get(f"/resources/{entry['resource_id']}")
+        assert resp.status_code == 200
+        assert resp.json()["content"] == content
+        assert datetime.fromisoformat(resp.json()["created_at"]).replace(tzinfo=None) == \
+            datetime.fromisoformat(entry["created_at"]).replace(tzinfo=None)
+
+    # Empty batch is a no-op
+    resp = await api_client.post("/ingest/batch", json={"items": []})
+    assert resp.status_code == 200
+    assert resp.json() == []
+
+    # Oversized batch is rejected before anything is stored
+    item = {"content": "x", "source": "batch:test"}
+    resp = await api_client.post("/ingest/batch", json={"items": [item] * (MAX_INGEST_BATCH + 1)})
+    assert resp.status_code == 422
@@ -2,8 +2,6 @@
 
 from __future__ import annotations
 
-import tempfile
-from pathlib import Path
 from uuid import uuid4
 
 import pytest
@@ -29,184 +27,103 @@ from kiroku_memory.search import (
 class TestClassifyIntent:
     """Unit tests for rule-based intent classifier"""
 
-    def test_entity_lookup_english(self):
-        result = classify_intent("about Claude")
-        assert isinstance(result, EntityLookup)
-        assert result.entity == "claude"
-
-    def test_entity_lookup_chinese(self):
-        result = classify_intent("關於 Python")
-        assert isinstance(result, EntityLookup)
-        assert result.entity == "python"
-
-    def test_entity_lookup_what_about(self):
-        result = classify_intent("what do you know about Alice?")
-        assert isinstance(result, EntityLookup)
-
-    def test_entity_lookup_chinese_suffix(self):
-        result = classify_intent("Python是什麼")
-        assert isinstance(result, EntityLookup)
-
-    def test_temporal_recent(self):
-        result = classify_intent("recent")
-        assert isinstance(result, Temporal)
-        assert result.days == 7
-
-    def test_temporal_chinese(self):
-        result = classify_intent("最近")
-        assert isinstance(result, Temporal)
-        assert result.days == 7
-
-    def test_temporal_last_n_days(self):
-        result = classify_intent("last 3 days")
-        assert isinstance(result, Temporal)
-        assert result.days == 3
-
-    def test_temporal_last_week(self):
-        result = classify_intent("last week")
-        assert isinstance(result, Temporal)
-        assert result.days == 7
-
-    def test_temporal_this_month(self):
-        result = classify_intent("這個月")
-        assert isinstance(result, Temporal)
-        assert result.days == 30
-
-    def test_aspect_preferences(self):
-        result = classify_intent("preferences")
-        assert isinstance(result, AspectFilter)
-        assert result.category == "preferences"
-
-    def test_aspect_chinese_preferences(self):
-        result = classify_intent("偏好")
-        assert isinstance(result, AspectFilter)
-        assert result.category == "preferences"
-
-    def test_aspect_goals(self):
-        result = classify_intent("goals")
-        assert isinstance(result, AspectFilter)
-        assert result.category == "goals"
-
-    def test_aspect_skills(self):
-        result = classify_intent("skills")
-        assert isinstance(result, AspectFilter)
-        assert result.category == "skills"
-
-    def test_aspect_identity(self):
-        result = classify_intent("identity")
-        assert isinstance(result, AspectFilter)
-        assert result.category == "identity"
-
-    def test_aspect_identity_chinese(self):
-        result = classify_intent("身份")
-        assert isinstance(result, AspectFilter)
-        assert result.category == "identity"
-
-    def test_aspect_behaviors(self):
-        result = classify_intent("習慣")
-        assert isinstance(result, AspectFilter)
-        assert result.category == "behaviors"
-
-    def test_aspect_behaviors_english(self):
-        result = classify_intent("routine")
-        assert isinstance(result, AspectFilter)
-        assert result.category == "behaviors"
-
-    def test_semantic_default(self):
-        result = classify_intent("how to use FastAPI")
-        assert isinstance(result, SemanticSearch)
-
-    def test_semantic_random(self):
-        result = classify_intent("completely random text")
-        assert isinstance(result, SemanticSearch)
+    @pytest.mark.parametrize(
+        "query, intent_cls, attr, expected",
+        [
+            pytest.param("about Claude", EntityLookup, "entity", "claude", id="entity_lookup_english"),
+            pytest.param("關於 Python", EntityLookup, "entity", "python", id="entity_lookup_chinese"),
+            pytest.param("what do you know about Alice?", EntityLookup, None, None, id="entity_lookup_what_about"),
+            pytest.param("Python是什麼", EntityLookup, None, None, id="entity_lookup_chinese_suffix"),
+            pytest.param("recent", Temporal, "days", 7, id="temporal_recent"),
+            pytest.param("最近", Temporal, "days", 7, id="temporal_chinese"),
+            pytest.param("last 3 days", Temporal, "days", 3, id="temporal_last_n_days"),
+            pytest.param("last week", Temporal, "days", 7, id="temporal_last_week"),
+            pytest.param("這個月", Temporal, "days", 30, id="temporal_this_month"),
+            pytest.param("preferences", AspectFilter, "category", "preferences", id="aspect_preferences"),
+            pytest.param("偏好", AspectFilter, "category", "preferences", id="aspect_chinese_preferences"),
+            pytest.param("goals", AspectFilter, "category", "goals", id="aspect_goals"),
+            pytest.param("skills", AspectFilter, "category", "skills", id="aspect_skills"),
+            pytest.param("identity", AspectFilter, "category", "identity", id="aspect_identity"),
+            pytest.param("身份", AspectFilter, "category", "identity", id="aspect_identity_chinese"),
+            pytest.param("習慣", AspectFilter, "category", "behaviors", id="aspect_behaviors"),
+            pytest.param("routine", AspectFilter, "category", "behaviors", id="aspect_behaviors_english"),
+            pytest.param("how to use FastAPI", SemanticSearch, None, None, id="semantic_default"),
+            pytest.param("completely random text", SemanticSearch, None, None, id="semantic_random"),
+        ],
+    )
+    def test_classify_intent(self, query, intent_cls, attr, expected):
+        result = classify_intent(query)
+        assert isinstance(result, intent_cls)
+        if attr is not None:
+            assert getattr(result, attr) == expected
 
 
 # ============ Smart Search Integration Tests (SurrealDB) ============
 
 
 @pytest_asyncio.fixture
-async def surreal_uow_with_data():
+async def surreal_uow_with_data(surreal_uow):
     """Create SurrealDB UoW with pre-populated test data"""
-    pytest.importorskip("surrealdb")
-
-    from surrealdb import AsyncSurreal
-    from kiroku_memory.db.repositories.surrealdb import SurrealUnitOfWork
-
-    with tempfile.TemporaryDirectory() as tmpdir:
-        url = f"file://{tmpdir}/test"
-        client = AsyncSurreal(url)
-        await client.connect()
-        await client.use("test", "test")
-
-        schema_path = Path(__file__).parent.parent / "kiroku_memory" / "db" / "surrealdb" / "schema.surql"
-        if schema_path.exists():
-            schema_sql = schema_path.read_text()
-            await client.query(schema_sql)
-
-        uow = SurrealUnitOfWork(client)
-
-        from kiroku_memory.entity_resolution import resolve_entity
-
-        # Populate test data
-        items = [
-            ItemEntity(
-                id=uuid4(),
-                subject="user",
-                predicate="prefers",
-                object="dark mode",
-                category="preferences",
-                confidence=0.9,
-                canonical_subject=resolve_entity("user"),
-                canonical_object=resolve_entity("dark mode"),
-            ),
-            ItemEntity(
-                id=uuid4(),
-                subject="user",
-                predicate="uses",
-                object="vim",
-                category="preferences",
-                confidence=0.85,
-                canonical_subject=resolve_entity("user"),
-                canonical_object=resolve_entity("vim"),
-            ),
-            ItemEntity(
-                id=uuid4(),
-                subject="user",
-                predicate="works_at",
-                object="Acme Corp",
-                category="facts",
-                confidence=1.0,
-                canonical_subject=resolve_entity("user"),
-                canonical_object=resolve_entity("Acme Corp"),
-            ),
-            ItemEntity(
-                id=uuid4(),
-                subject="user",
-                predicate="wants_to",
-                object="learn Rust",
-                category="goals",
-                confidence=0.8,
-                canonical_subject=resolve_entity("user"),
-                canonical_object=resolve_entity("learn Rust"),
-            ),
-        ]
-
-        for item in items:
-            await uow.items.create(item)
-
-        # Add graph edges
-        edges = [
-            GraphEdgeEntity(subject="user", predicate="prefers", object="dark mode"),
-            GraphEdgeEntity(subject="user", predicate="uses", object="vim"),
-            GraphEdgeEntity(subject="user", predicate="works_at", object="Acme Corp"),
-            GraphEdgeEntity(subject="vim", predicate="is_a", object="text editor"),
-        ]
-        for edge in edges:
-            await uow.graph.create(edge)
-
-        yield uow
-
-        await client.close()
+    from kiroku_memory.entity_resolution import resolve_entity
+
+    uow = surreal_uow
+
+    # Populate test data
+    items = [
+        ItemEntity(
+            id=uuid4(),
+            subject="user",
+            predicate="prefers",
+            object="dark mode",
+            category="preferences",
+            confidence=0.9,
+            canonical_subject=resolve_entity("user"),
+            canonical_object=resolve_entity("dark mode"),
+        ),
+        ItemEntity(
+            id=uuid4(),
+            subject="user",
+            predicate="uses",
+            object="vim",
+            category="preferences",
+            confidence=0.85,
+            canonical_subject=resolve_entity("user"),
+            canonical_object=resolve_entity("vim"),
+        ),
+        ItemEntity(
+            id=uuid4(),
+            subject="user",
+            predicate="works_at",
+            object="Acme Corp",
+            category="facts",
+            confidence=1.0,
+            canonical_subject=resolve_entity("user"),
+            canonical_object=resolve_entity("Acme Corp"),
+        ),
+        ItemEntity(
+            id=uuid4(),
+            subject="user",
+            predicate="wants_to",
+            object="learn Rust",
+            category="goals",
+            confidence=0.8,
+            canonical_subject=resolve_entity("user"),
+            canonical_object=resolve_entity("learn Rust"),
+        ),
+    ]
+
+    await uow.items.create_many(items)
+
+    # Add graph edges
+    edges = [
+        GraphEdgeEntity(subject="user", predicate="prefers", object="dark mode"),
+        GraphEdgeEntity(subject="user", predicate="uses", object="vim"),
+        GraphEdgeEntity(subject="user", predicate="works_at", object="Acme Corp"),
+        GraphEdgeEntity(subject="vim", predicate="is_a", object="text editor"),
+    ]
+    await uow.graph.create_many(edges)
+
+    yield uow
 
 
 @pytest.mark.asyncio
@@ -289,10 +206,7 @@ async def test_graph_edge_created_on_item_create(surreal_uow_with_data):
     """Creating an item with full SPO should also create a graph edge"""
     uow = surreal_uow_with_data
 
-    # Count edges before
-    count_before = await uow.graph.count()
-
-    # Create a new item
+    # Create a new item (the fixture has no edges from Alice)
     item = ItemEntity(
         subject="Alice",
         predicate="knows",
@@ -309,18 +223,43 @@ async def test_graph_edge_created_on_item_create(surreal_uow_with_data):
     )
     await uow.graph.create(edge)
 
-    count_after = await uow.graph.count()
-    assert count_after == count_before + 1
-
-    # Verify we can find it
+    # Exactly one new edge, findable by subject
     edges = await uow.graph.get_by_subject("Alice")
-    assert len(edges) >= 1
-    assert any(e.object == "Bob" for e in edges)
+    assert len(edges) == 1
+    assert edges[0].object == "Bob"
 
 
 # ============ P1-6: Graph-Enhanced Retrieval Tests ============
 
 
+def _parse_context(context: str) -> tuple[dict[str, set[str]], dict[str, list[str]]]:
+    """Split tiered context into per-category item and **Related:** triples"""
+    lines = context.split("\n")
+    current_category = None
+    category_items = {}  # category -> set of triple strings
+    category_related = {}  # category -> list of triple strings
+
+    in_related = False
+    for line in lines:
+        if line.startswith("### "):
+            current_category = line[4:].strip().lower()
+            category_items[current_category] = set()
+            category_related[current_category] = []
+            in_related = False
+        elif line.strip() == "**Related:**":
+            in_related = True
+        elif line.startswith("- ") and current_category:
+            triple_text = line[2:].strip()
+            if in_related:
+                category_related[current_category].append(triple_text)
+            else:
+                category_items[current_category].add(triple_text)
+        elif line.strip() == "" or line.startswith("**"):
+            in_related = False
+
+    return category_items, category_related
+
+
 @pytest.mark.asyncio
 async def test_smart_search_returns_created_at(surreal_uow_with_data):
     """smart_search result dicts should include created_at and status fields"""
@@ -363,29 +302,7 @@ async def test_context_graph_no_duplicate_within_category(surreal_uow_with_data)
         record_access=False,
     )
 
-    # Parse context into per-category blocks
-    lines = context.split("\n")
-    current_category = None
-    category_items = {}  # category -> set of triple strings
-    category_related = {}  # category -> list of triple strings
-
-    in_related = False
-    for line in lines:
-        if line.startswith("### "):
-            current_category = line[4:].strip().lower()
-            category_items[current_category] = set()
-            category_related[current_category] = []
-            in_related = False
-        elif line.strip() == "**Related:**":
-            in_related = True
-        elif line.startswith("- ") and current_category:
-            triple_text = line[2:].strip()
-            if in_related:
-                category_related[current_category].append(triple_text)
-            else:
-                category_items[current_category].add(triple_text)
-        elif line.strip() == "" or line.startswith("**"):
-            in_related = False
+    category_items, category_related = _parse_context(context)
 
     # Within each category, Related items should NOT duplicate the category's own items
     for cat, related_list in category_related.items():
@@ -0,0 +1,133 @@
+"""Tests for skill/scripts/stop-hook.py (regex heuristics and the ingest worker)"""
+
+from __future__ import annotations
+
+import importlib.util
+import sys
+from pathlib import Path
+
+import pytest
+
+SCRIPTS_DIR = Path(__file__).resolve().parent.parent / "skill" / "scripts"
+
+
+@pytest.fixture(scope="module")
+def hook():
+    """Load the hook script (its file name is not importable as a module)"""
+    spec = importlib.util.spec_from_file_location("stop_hook", SCRIPTS_DIR / "stop-hook.py")
+    module = importlib.util.module_from_spec(spec)
+    sys.path.insert(0, str(SCRIPTS_DIR))
+    try:
+        spec.loader.exec_module(module)
+    finally:
+        sys.path.remove(str(SCRIPTS_DIR))
+    return module
+
+
+# ============ weighted_length ============
+
+
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        ("", 0.0),
+        ("dark mode", 9.0),
+        ("我喜歡 tabs", 3 * 2.5 + 5),
+        ("カタカナ", 4 * 2.5),
+    ],
+)
+def test_weighted_length(hook, content, expected):
+    assert hook.weighted_length(content) == expected
+
+
+# ============ detect_category ============
+
+
+@pytest.mark.parametrize(
+    "content, expected",
+    [
+        ("I prefer dark mode", "preferences"),
+        ("My goal is to ship v2", "goals"),
+        ("We discovered a race condition", "facts"),
+        # Preferences win even when a goals keyword comes first
+        ("I want to plan, but I like tabs", "preferences"),
+        # Overlapping keywords: "goal" and "like" share the "l"
+        ("goalike", "preferences"),
+    ],
+)
+def test_detect_category(hook, content, expected):
+    assert hook.detect_category(content) == expected
+
+
+# ============ extract_conclusion_snippets ============
+
+
+def test_conclusion_snippets_follow_marker_priority(hook):
+    """Snippets come out in CONCLUSION_MARKERS order, not text order"""
+    text = "Summary: the cache was stale for hours. Solution: clear the cache on deploy."
+    assert hook.extract_conclusion_snippets(text) == [
+        "Solution: clear the cache on deploy.",
+        "Summary: the cache was stale for hours.",
+    ]
+
+
+def test_conclusion_snippets_overlapping_markers(hook):
+    """Overlapping markers (總結 / 結論 in 總結論) each yield their own match"""
+    # No sentence break in the first 100 chars, so each snippet starts
+    # exactly 100 chars before its marker (distinct filler keeps the
+    # 50-char dedup prefixes apart)
+    text = "".join(chr(ord("a") + i % 26) for i in range(120)) + "總結論是快取失效。"
+    summary_at = text.index("總結")
+    conclusion_at = text.index("結論")
+    # 結論 (conclusion) outranks 總結 (summary)
+    assert hook.extract_conclusion_snippets(text) == [
+        text[conclusion_at - 100:],
+        text[summary_at - 100:],
+    ]
+
+
+# ============ run_ingest_worker ============
+
+
+@pytest.fixture
+def cache_dir(hook, tmp_path, monkeypatch):
+    """Point the dedup cache at a temp dir"""
+    import hook_common
+
+    monkeypatch.setattr(hook_common, "CACHE_DIR", tmp_path)
+    monkeypatch.setattr(hook_common, "CACHE_FILE", tmp_path / "recent_saves.json")
+    return tmp_path
+
+
+def _run_worker(hook, cache_dir, monkeypatch, results):
+    transcript = cache_dir / "t.jsonl"
+    transcript.write_text("x" * 40)
+    job = cache_dir / "job.json"
+    job.write_bytes(hook.json_dumps({
+        "source": "project:p",
+        "candidates": [["user", "I prefer tabs"], ["user", "I like dark mode"]],
+        "transcript_path": str(transcript),
+        "offset": 0,
+        "end": 40,
+    }))
+    monkeypatch.setattr(hook, "ingest_all", lambda candidates, source: results)
+    hook.run_ingest_worker(str(job))
+    assert not job.exists()
+    recent = hook.load_recent_saves()
+    live = hook.index_recent_saves(recent, hook.time.time())
+    return recent, live, str(transcript)
+
+
+def test_ingest_worker_records_saves_and_offset(hook, cache_dir, monkeypatch):
+    recent, live, transcript = _run_worker(hook, cache_dir, monkeypatch, [True, True])
+    assert hook.is_duplicate("I prefer tabs", "project:p", live)
+    assert hook.is_duplicate("I like dark mode", "project:p", live)
+    assert hook.get_transcript_offset(recent, transcript) == 40
+
+
+def test_ingest_worker_keeps_offset_on_failure(hook, cache_dir, monkeypatch):
+    """A failed POST leaves the offset alone so the next run retries the chunk"""
+    recent, live, transcript = _run_worker(hook, cache_dir, monkeypatch, [True, False])
+    assert hook.is_duplicate("I prefer tabs", "project:p", live)
+    assert not hook.is_duplicate("I like dark mode", "project:p", live)
+    assert hook.get_transcript_offset(recent, transcript) == 0
@@ -261,6 +261,14 @@ if [ "$CLEAN_BUNDLE" = true ]; then
         cd - > /dev/null
     fi
 
+    # Precompile bytecode once at build time. The installed bundle is usually
+    # read-only (signed .app, Program Files), so without .pyc files every
+    # launch recompiles all imported modules. unchecked-hash skips the
+    # per-import source mtime check since bundled sources never change.
+    echo "Precompiling bytecode..."
+    "$PYTHON_BIN" -m compileall -q -j 0 --invalidation-mode unchecked-hash "$PYTHON_DIR" \
+        || echo "Warning: some modules failed to compile"
+
     # Verify imports still work after cleanup
     echo "Verifying imports after cleanup..."
     "$PYTHON_BIN" -c "
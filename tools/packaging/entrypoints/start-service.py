@@ -10,62 +10,268 @@ to start the FastAPI service. It handles:
 - Health check endpoint verification
 
 Usage:
-    python start-service.py [--host HOST] [--port PORT] [--data-dir DIR]
+    python start-service.py [--host HOST] [--port PORT] [--uds PATH]
+                            [--data-dir DIR] [--skip-import-check]
+                            [--access-log] [--dev]
 """
 
 import argparse
+import asyncio
+import importlib
+import importlib.util
+import json
 import os
+import shutil
+import subprocess
 import sys
 import time
-from pathlib import Path
+
+APP_TARGET = "kiroku_memory.api:app"
+
+# Seconds a request waits for the app to finish loading before getting a 503
+STARTUP_TIMEOUT = 30.0
+
+# Seconds in-flight requests get to finish on shutdown before being cancelled
+GRACEFUL_SHUTDOWN_TIMEOUT = 30
+
+# Seconds an idle connection stays open; the UI makes frequent small calls
+KEEP_ALIVE_TIMEOUT = 75
 
 
 def setup_environment(data_dir: str) -> None:
     """Configure environment variables for Kiroku Memory."""
-    # Ensure data directory exists
-    data_path = Path(data_dir)
-    data_path.mkdir(parents=True, exist_ok=True)
-
-    # SurrealDB configuration
-    surreal_path = data_path / "surrealdb" / "kiroku"
-    surreal_path.parent.mkdir(parents=True, exist_ok=True)
+    # SurrealDB configuration; creating its parent also creates the data directory
+    surreal_dir = os.path.join(data_dir, "surrealdb")
+    os.makedirs(surreal_dir, exist_ok=True)
+    surreal_path = os.path.join(surreal_dir, "kiroku")
 
-    os.environ.setdefault("BACKEND", "surrealdb")
-    os.environ.setdefault("SURREAL_URL", f"file://{surreal_path}")
-    os.environ.setdefault("SURREAL_NAMESPACE", "kiroku")
-    os.environ.setdefault("SURREAL_DATABASE", "memory")
+    # Plain path, not as_uri(): SurrealConnection strips "file://" to get the
+    # directory, and as_uri() would percent-encode spaces ("Application Support")
+    defaults = {
+        "BACKEND": "surrealdb",
+        "SURREAL_URL": f"file://{surreal_path}",
+        "SURREAL_NAMESPACE": "kiroku",
+        "SURREAL_DATABASE": "memory",
+    }
+    for key, value in defaults.items():
+        os.environ.setdefault(key, value)
 
-    # Disable Python buffering for better log output
+    # Disable Python buffering for better log output. The env var only reaches
+    # child processes; this interpreter's stdout is line-buffered directly.
     os.environ["PYTHONUNBUFFERED"] = "1"
+    if hasattr(sys.stdout, "reconfigure"):
+        sys.stdout.reconfigure(line_buffering=True)
+
+
+REQUIRED_MODULES = ("fastapi", "uvicorn", "surrealdb", "kiroku_memory.api")
 
 
 def verify_imports() -> bool:
-    """Verify all required modules can be imported."""
-    try:
-        import fastapi  # noqa: F401
-        import uvicorn  # noqa: F401
-        import surrealdb  # noqa: F401
-        import kiroku_memory.api  # noqa: F401
+    """Verify all required modules are installed, without importing them."""
+    if getattr(sys, "frozen", False):
+        # Frozen builds only contain modules that imported at build time
         return True
-    except ImportError as e:
-        print(f"[ERROR] Failed to import required module: {e}", file=sys.stderr)
-        return False
+    for name in REQUIRED_MODULES:
+        try:
+            found = importlib.util.find_spec(name) is not None
+        except ImportError:
+            # Parent package of a dotted name is missing
+            found = False
+        if not found:
+            print(f"[ERROR] Required module not found: {name}", file=sys.stderr)
+            return False
+    return True
+
+
+async def _send_json(send, status: int, body: dict) -> None:
+    """Send a complete JSON HTTP response over raw ASGI."""
+    payload = json.dumps(body).encode()
+    await send({
+        "type": "http.response.start",
+        "status": status,
+        "headers": [
+            (b"content-type", b"application/json"),
+            (b"content-length", str(len(payload)).encode()),
+        ],
+    })
+    await send({"type": "http.response.body", "body": payload})
+
+
+class DeferredApp:
+    """
+    ASGI wrapper that lets uvicorn bind the socket before the app is imported.
+
+    The real app is imported on a worker thread during lifespan startup and its
+    own lifespan is then driven to completion. Until it is ready, /health
+    answers {"status": "starting"} and other requests wait up to
+    STARTUP_TIMEOUT seconds before getting a 503.
+    """
+
+    def __init__(self, target: str, timeout: float = STARTUP_TIMEOUT):
+        self._module, self._attr = target.split(":", 1)
+        self._timeout = timeout
+        self._app = None
+        self._error: Exception | None = None
+        self._ready = asyncio.Event()
+        self._loader: asyncio.Task | None = None
+        self._lifespan: asyncio.Task | None = None
+        self._lifespan_in: asyncio.Queue = asyncio.Queue()
+        self._lifespan_out: asyncio.Queue = asyncio.Queue()
+
+    async def __call__(self, scope, receive, send) -> None:
+        if scope["type"] == "lifespan":
+            await self._run_lifespan(receive, send)
+            return
+
+        if not self._ready.is_set():
+            if scope["type"] == "http" and scope["path"] == "/health":
+                await _send_json(send, 200, {"status": "starting"})
+                return
+            try:
+                await asyncio.wait_for(self._ready.wait(), self._timeout)
+            except asyncio.TimeoutError:
+                pass
+
+        if self._app is None:
+            if scope["type"] == "http":
+                status = "error" if self._error else "starting"
+                await _send_json(send, 503, {"status": status})
+            elif scope["type"] == "websocket":
+                await send({"type": "websocket.close", "code": 1013})
+            return
+
+        await self._app(scope, receive, send)
+
+    async def _run_lifespan(self, receive, send) -> None:
+        """Report startup at once, load the app in the background, forward shutdown."""
+        while True:
+            message = await receive()
+            if message["type"] == "lifespan.startup":
+                self._loader = asyncio.create_task(self._load())
+                await send({"type": "lifespan.startup.complete"})
+            elif message["type"] == "lifespan.shutdown":
+                await self._shutdown()
+                await send({"type": "lifespan.shutdown.complete"})
+                return
+
+    async def _load(self) -> None:
+        """Import the app off the event loop, then run its own lifespan startup."""
+        try:
+            module = await asyncio.to_thread(importlib.import_module, self._module)
+            app = getattr(module, self._attr)
+
+            scope = {"type": "lifespan", "asgi": {"version": "3.0"}, "state": {}}
+            self._lifespan = asyncio.create_task(
+                app(scope, self._lifespan_in.get, self._lifespan_out.put)
+            )
+            await self._lifespan_in.put({"type": "lifespan.startup"})
+            message = await self._lifespan_message()
+            if message["type"] != "lifespan.startup.complete":
+                raise RuntimeError(message.get("message") or "app startup failed")
+
+            self._app = app
+            print("[Kiroku] Application loaded")
+        except Exception as e:
+            self._error = e
+            print(f"[ERROR] Failed to load application: {e}", file=sys.stderr)
+        finally:
+            self._ready.set()
 
+    async def _lifespan_message(self) -> dict:
+        """Next message from the app's lifespan; raises if the app exits first."""
+        get = asyncio.ensure_future(self._lifespan_out.get())
+        await asyncio.wait({get, self._lifespan}, return_when=asyncio.FIRST_COMPLETED)
+        if get.done():
+            return get.result()
+        get.cancel()
+        self._lifespan.result()
+        raise RuntimeError("app lifespan exited during startup")
 
-def start_service(host: str, port: int) -> None:
-    """Start the uvicorn server."""
+    async def _shutdown(self) -> None:
+        """Stop loading if still in progress, then run the app's lifespan shutdown."""
+        if self._loader is not None and not self._loader.done():
+            self._loader.cancel()
+            try:
+                await self._loader
+            except asyncio.CancelledError:
+                pass
+
+        if self._app is not None:
+            await self._lifespan_in.put({"type": "lifespan.shutdown"})
+            try:
+                await self._lifespan_message()
+            except Exception as e:
+                print(f"[ERROR] Application shutdown failed: {e}", file=sys.stderr)
+
+
+def select_server_impls() -> tuple[str, str]:
+    """Pick uvloop and httptools (uvicorn[standard]) when installed, else uvicorn's auto."""
+    loop = "uvloop" if importlib.util.find_spec("uvloop") is not None else "auto"
+    http = "httptools" if importlib.util.find_spec("httptools") is not None else "auto"
+    return loop, http
+
+
+def start_service(
+    host: str, port: int, access_log: bool = False, uds: str | None = None
+) -> None:
+    """Start the uvicorn server, on a Unix domain socket if ``uds`` is given."""
     import uvicorn
 
-    print(f"[Kiroku] Starting service on {host}:{port}")
-    print(f"[Kiroku] Backend: {os.environ.get('BACKEND', 'unknown')}")
-    print(f"[Kiroku] SurrealDB URL: {os.environ.get('SURREAL_URL', 'unknown')}")
+    if uds and sys.platform == "win32":
+        print("[Kiroku] Unix sockets are not supported on Windows, using TCP")
+        uds = None
+
+    loop, http = select_server_impls()
+    bind = f"unix:{uds}" if uds else f"{host}:{port}"
+    backend = os.environ.get("BACKEND", "unknown")
+    surreal_url = os.environ.get("SURREAL_URL", "unknown")
 
-    uvicorn.run(
-        "kiroku_memory.api:app",
+    # One write for the whole status block (stdout is line-buffered)
+    print("\n".join([
+        f"[Kiroku] Starting service on {bind}",
+        f"[Kiroku] Backend: {backend}",
+        f"[Kiroku] SurrealDB URL: {surreal_url}",
+        f"[Kiroku] Event loop: {loop}, HTTP parser: {http}",
+    ]))
+
+    # Bind first; the app is imported in the background (see DeferredApp)
+    config = uvicorn.Config(
+        DeferredApp(APP_TARGET),
         host=host,
         port=port,
+        uds=uds,
+        loop=loop,
+        http=http,
         log_level="info",
-        access_log=True,
+        access_log=access_log,
+        server_header=False,
+        timeout_keep_alive=KEEP_ALIVE_TIMEOUT,
+        timeout_graceful_shutdown=GRACEFUL_SHUTDOWN_TIMEOUT,
+    )
+    # Server handles SIGINT/SIGTERM itself and then runs the app's shutdown
+    uvicorn.Server(config).run()
+
+
+def start_dev_service(host: str, port: int) -> None:
+    """Serve with code reloading for development; uses uvicorn-hmr when installed."""
+    package_dir = os.path.dirname(importlib.util.find_spec("kiroku_memory").origin)
+    print(f"[Kiroku] Dev mode on {host}:{port}, watching {package_dir}")
+
+    # Only the CLI installed with this interpreter sees our dependencies
+    hmr = shutil.which("uvicorn-hmr", path=os.path.dirname(sys.executable))
+    if hmr is None:
+        import uvicorn
+
+        # Restarts the whole worker process on every change
+        uvicorn.run(APP_TARGET, host=host, port=port, reload=True, reload_dirs=[package_dir])
+        return
+
+    # uvicorn-hmr re-executes only the changed modules in-process. Its
+    # documented CLI is used because the Python signature differs between
+    # releases; it resolves the app module relative to the working directory.
+    subprocess.run(
+        [hmr, APP_TARGET, "--reload-include", package_dir, "--host", host, "--port", str(port)],
+        cwd=os.path.dirname(package_dir),
     )
 
 
@@ -84,32 +290,63 @@ def main() -> int:
         default=8000,
         help="Port to listen on (default: 8000)",
     )
+    parser.add_argument(
+        "--uds",
+        default=None,
+        help="Listen on this Unix domain socket instead of host/port "
+        "(ignored on Windows)",
+    )
     parser.add_argument(
         "--data-dir",
         default=None,
         help="Data directory for SurrealDB (default: current directory)",
     )
+    parser.add_argument(
+        "--skip-import-check",
+        action="store_true",
+        help="Skip the required-module check (e.g. for bundled builds)",
+    )
+    parser.add_argument(
+        "--dev",
+        action="store_true",
+        help="Reload on code changes (uses uvicorn-hmr if installed)",
+    )
+    parser.add_argument(
+        "--access-log",
+        action="store_true",
+        default=os.environ.get("KIROKU_ACCESS_LOG") == "1",
+        help="Log every request (default: off, or KIROKU_ACCESS_LOG=1)",
+    )
     args = parser.parse_args()
 
     # Default data directory
-    data_dir = args.data_dir or os.getcwd()
+    data_dir = os.path.abspath(args.data_dir or os.getcwd())
 
-    print("[Kiroku] Initializing service...")
-    print(f"[Kiroku] Data directory: {data_dir}")
+    print(f"[Kiroku] Initializing service...\n[Kiroku] Data directory: {data_dir}")
 
     # Setup environment
     setup_environment(data_dir)
 
     # Verify imports
-    if not verify_imports():
+    if not args.skip_import_check and not verify_imports():
         return 1
 
     # Start service
     try:
-        start_service(args.host, args.port)
+        if args.dev:
+            start_dev_service(args.host, args.port)
+        else:
+            start_service(
+                args.host, args.port, access_log=args.access_log, uds=args.uds
+            )
         return 0
     except KeyboardInterrupt:
         print("\n[Kiroku] Service stopped by user")
+        # uvicorn has already run the app's shutdown; skip interpreter teardown
+        if os.environ.get("KIROKU_FAST_EXIT", "1") == "1":
+            sys.stdout.flush()
+            sys.stderr.flush()
+            os._exit(0)
         return 0
     except Exception as e:
         print(f"[ERROR] Service failed: {e}", file=sys.stderr)